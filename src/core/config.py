@@ -10,7 +10,8 @@ SERVERS = {
 }
 
 # Ping configuration
-PING_THRESHOLD = 60  # ms (for deviation logging)
+PING_THRESHOLD_HEALTHY = 50  # ms
+PING_THRESHOLD_DEGRADED = 60  # ms (also ping spike threshold)
 PING_INTERVAL = 1  # seconds between pings
 PRESERVED_MINUTES = 10  # minutes to preserve and display per tab
 
@@ -38,6 +39,6 @@ ANIMATION_SETTINGS = {
 }
 
 # File paths
-DEVIATIONS_FILE = "deviations.txt"
+PING_SPIKES_FILE = "logs/ping_spikes.log"
 ICON_FILE = "assets/icon.ico"
 BACKGROUND_FILE = "assets/background.png"
@@ -6,8 +6,6 @@ import threading
 import time
 import os
 import logging
-from collections import deque
-from datetime import timedelta
 
 from src.core.config import (
     SERVERS,
@@ -22,6 +20,14 @@ from src.core.ping_service import PingService
 from src.gui.main_window import MainWindow
 from src.gui.system_tray import SystemTray
 from src.utils.ping_spike_logger import PingSpikeLogger
+from src.utils.statistics import ServerStats
+
+
+CLEANUP_INTERVAL = 3600  # seconds between ping spike log cleanups
+
+_PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
 
 
 class PingMonitor:
@@ -31,6 +37,8 @@ class PingMonitor:
         self.logger = logging.getLogger(__name__)
         # Configuration
         self.servers = SERVERS
+        # Servers are fixed after startup, so enumerate them once
+        self._server_names = tuple(self.servers.keys())
         self.ping_threshold_healthy = PING_THRESHOLD_HEALTHY
         self.ping_threshold_degraded = PING_THRESHOLD_DEGRADED
         self.ping_interval = PING_INTERVAL
@@ -40,10 +48,11 @@ class PingMonitor:
         )
 
         # Get first server for tray icon status
-        self.first_server = list(self.servers.keys())[0]
+        self.first_server = self._server_names[0]
 
         # Application state
         self.running = True
+        self._shutting_down = False
         self.window_visible = True  # Start visible now
 
         # Initialize components
@@ -52,22 +61,11 @@ class PingMonitor:
         self.system_tray = None
         self.ping_spike_logger = None
 
-        # Statistics tracking
-        self.ping_times = {}
-        self.ping_time_history = {}
-        self.ping_spike_counts = {}
-        self.pinged_counts = {}
-        self.first_ping_timestamps = {}
-        for server_name in self.servers.keys():
-            self.ping_times[server_name] = deque(
-                maxlen=self.max_display_lines_per_server
-            )
-            self.ping_time_history[server_name] = deque(
-                maxlen=self.max_display_lines_per_server
-            )
-            self.ping_spike_counts[server_name] = 0
-            self.pinged_counts[server_name] = 0
-            self.first_ping_timestamps[server_name] = None
+        # Statistics tracking - one ServerStats per server, one lookup per result
+        self.server_stats = {
+            server_name: ServerStats(self.max_display_lines_per_server)
+            for server_name in self._server_names
+        }
 
         self._initialize_components()
 
@@ -89,12 +87,7 @@ class PingMonitor:
         self.main_window = MainWindow(self.servers, self)
 
         # Initialize system tray
-        icon_path = os.path.join(
-            os.path.dirname(
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            ),
-            ICON_FILE,
-        )
+        icon_path = os.path.join(_PROJECT_ROOT, ICON_FILE)
         self.system_tray = SystemTray(self, icon_path)
 
     def run(self):
@@ -128,126 +121,139 @@ class PingMonitor:
         """Start periodic cleanup of ping spike logs"""
 
         def cleanup_worker():
+            # Monotonic deadlines keep the hourly cadence stable across clock
+            # changes, and a failed cleanup still waits for the next slot.
+            next_cleanup = time.monotonic()
             while self.running:
                 try:
                     self.ping_spike_logger.cleanup_ping_spikes_file()
-                    time.sleep(3600)  # Run cleanup every hour
                 except Exception as e:
                     self.logger.exception("Error in cleanup worker: %s", e)
 
+                next_cleanup += CLEANUP_INTERVAL
+                time.sleep(max(0.0, next_cleanup - time.monotonic()))
+
         cleanup_thread = threading.Thread(target=cleanup_worker, daemon=True)
         cleanup_thread.start()
 
     def _process_ping_result(self, result):
         """Process a ping result and update displays"""
         server_name = result["server"]
+        timestamp = result["timestamp"]
 
-        # Format result for display
-        formatted_result = self.ping_service.format_ping_result(server_name, result)
+        # Keep the display history so hidden tabs can be rebuilt on show
+        self.ping_service.record_result(server_name, result)
 
         # Update statistics
-        self.pinged_counts[server_name] += 1
-        if self.first_ping_timestamps[server_name] is None:
-            self.first_ping_timestamps[server_name] = result["timestamp"]
-
-        if formatted_result["ping_time"] is not None:
-            self.ping_times[server_name].append(formatted_result["ping_time"])
-            self.ping_time_history[server_name].append(
-                (result["timestamp"], formatted_result["ping_time"])
-            )
+        stats = self.server_stats[server_name]
+        stats.pinged_count += 1
+        if stats.first_timestamp is None:
+            stats.first_timestamp = timestamp
+
+        ping_time = result["time"]
+        if result["status"] == "success" and ping_time is not None:
+            stats.ping_times.append(ping_time)
+            stats.history.append((timestamp, ping_time))
+            if ping_time > self.ping_threshold_degraded:
+                stats.last_failing_timestamp = timestamp
+            elif ping_time > self.ping_threshold_healthy:
+                stats.last_degraded_timestamp = timestamp
 
         # Check for ping spikes and log them
         if self.ping_service.is_ping_spike(result):
-            self.ping_spike_counts[server_name] += 1
+            stats.ping_spike_count += 1
             self.ping_spike_logger.log_ping_spike(server_name, result)
 
-        # Calculate statistics
-        statistics = self._calculate_statistics(server_name, result["timestamp"])
-
-        # Update GUI display
-        if self.main_window:
+        # Display strings and footer statistics are only built for a visible
+        # window; show() rebuilds the tabs from the stored history.
+        overall_status = None
+        if self.main_window and self.main_window.is_visible():
+            formatted_result = self.ping_service.format_ping_result(
+                server_name, result
+            )
+            statistics = self._calculate_statistics(stats, timestamp)
             self.main_window.update_display(server_name, formatted_result, statistics)
+            overall_status = statistics["overall_status"]
 
         # Update system tray icon based on first server status
         if server_name == self.first_server:
-            self.system_tray.update_health_status(statistics["overall_status"])
+            if overall_status is None:
+                overall_status = self._calculate_overall_status(stats, timestamp)
+            self.system_tray.update_health_status(overall_status)
+
+    def get_server_statistics(self, server_name):
+        """Current footer statistics for a server, e.g. when a tab is rebuilt"""
+        return self._calculate_statistics(self.server_stats[server_name], time.time())
 
-    def _calculate_statistics(self, server_name, now_timestamp):
+    def _calculate_statistics(self, stats, now_timestamp):
         """Calculate statistics for a server"""
-        elapsed_minutes = self._calculate_elapsed_minutes(server_name, now_timestamp)
-        overall_status = self._calculate_overall_status(server_name, now_timestamp)
+        elapsed_minutes = self._calculate_elapsed_minutes(stats, now_timestamp)
+        overall_status = self._calculate_overall_status(stats, now_timestamp)
 
-        if not self.ping_times[server_name]:
+        ping_times = stats.ping_times
+        if not ping_times:
             return {
                 "avg": 0,
                 "best": 0,
                 "worst": 0,
                 "ping_spikes": 0,
                 "overall_status": overall_status,
-                "pinged_count": self.pinged_counts[server_name],
+                "pinged_count": stats.pinged_count,
                 "elapsed_minutes": elapsed_minutes,
             }
 
-        ping_times = list(self.ping_times[server_name])
-        avg_ping = sum(ping_times) / len(ping_times)
-        best_ping = min(ping_times)
-        worst_ping = max(ping_times)
+        avg_ping = ping_times.average
+        best_ping = ping_times.minimum
+        worst_ping = ping_times.maximum
 
         return {
             "avg": avg_ping,
             "best": best_ping,
             "worst": worst_ping,
-            "ping_spikes": self.ping_spike_counts[server_name],
+            "ping_spikes": stats.ping_spike_count,
             "overall_status": overall_status,
-            "pinged_count": self.pinged_counts[server_name],
+            "pinged_count": stats.pinged_count,
             "elapsed_minutes": elapsed_minutes,
         }
 
-    def _calculate_overall_status(self, server_name, now_timestamp):
+    def _calculate_overall_status(self, stats, now_timestamp):
         """Calculate Healthy/Degraded/Failing for the last 5 minutes of data."""
-        ping_history = self.ping_time_history[server_name]
-        if not ping_history:
-            return "healthy"
-
-        window_start = now_timestamp - timedelta(minutes=5)
-        recent_pings = [
-            ping_time
-            for ping_timestamp, ping_time in ping_history
-            if ping_timestamp >= window_start
-        ]
-
-        if not recent_pings:
-            recent_pings = [ping_time for _, ping_time in ping_history]
-
-        if any(ping_time > self.ping_threshold_degraded for ping_time in recent_pings):
+        ping_history = stats.history
+        # The window never reaches past the oldest retained entry, and if
+        # nothing is recent the whole history is classified. That entry is the
+        # sentinel until the deque fills, which admits every sample.
+        oldest_timestamp = ping_history[0][0]
+        window_start = now_timestamp - 5 * 60
+        if ping_history[-1][0] < window_start or window_start < oldest_timestamp:
+            window_start = oldest_timestamp
+
+        # Only the newest sample above each threshold decides the outcome
+        last_failing = stats.last_failing_timestamp
+        if last_failing is not None and last_failing >= window_start:
             return "failing"
-        if any(ping_time > self.ping_threshold_healthy for ping_time in recent_pings):
+        last_degraded = stats.last_degraded_timestamp
+        if last_degraded is not None and last_degraded >= window_start:
             return "degraded"
         return "healthy"
 
-    def _calculate_elapsed_minutes(self, server_name, now_timestamp):
+    def _calculate_elapsed_minutes(self, stats, now_timestamp):
         """Calculate elapsed minutes for display with midpoint rounding behavior."""
-        first_timestamp = self.first_ping_timestamps[server_name]
+        first_timestamp = stats.first_timestamp
         if first_timestamp is None:
             return 1
 
-        elapsed_seconds = max(0, (now_timestamp - first_timestamp).total_seconds())
+        elapsed_seconds = max(0, now_timestamp - first_timestamp)
         return max(1, int((elapsed_seconds + 30) // 60))
 
     def reset_server_statistics(self, server_name):
         """Reset monitor-side statistics for one server."""
-        if server_name not in self.servers:
-            return
-
-        self.ping_times[server_name].clear()
-        self.ping_time_history[server_name].clear()
-        self.ping_spike_counts[server_name] = 0
-        self.pinged_counts[server_name] = 0
-        self.first_ping_timestamps[server_name] = None
+        stats = self.server_stats.get(server_name)
+        if stats is not None:
+            stats.reset()
 
     def reset_all_statistics(self):
         """Reset monitor-side statistics for all servers."""
-        for server_name in self.servers.keys():
+        for server_name in self._server_names:
             self.reset_server_statistics(server_name)
 
     def show_window(self, icon=None, item=None):
@@ -276,20 +282,25 @@ class PingMonitor:
 
     def _shutdown(self):
         """Clean shutdown of all components"""
-        self.logger.info("Shutting down Ping Monitor")
+        # Stop the worker loops first, they check this flag every iteration
         self.running = False
+        if self._shutting_down:
+            return
+        self._shutting_down = True
+        self.logger.info("Shutting down Ping Monitor")
 
         # Stop ping service
         if self.ping_service:
             self.ping_service.stop()
 
+        # Flush buffered ping spikes
+        if self.ping_spike_logger:
+            self.ping_spike_logger.close()
+
         # Stop system tray
         if self.system_tray:
             self.system_tray.stop()
 
-        # Destroy GUI
+        # Destroy GUI from the Tk loop, whichever thread asked to quit
         if self.main_window:
-            try:
-                self.main_window.destroy()
-            except:
-                pass
+            self.main_window.destroy()
@@ -3,14 +3,157 @@ Ping functionality for monitoring network connectivity.
 """
 
 import os
+import ctypes
 import subprocess
 import re
+import socket
+import select
+import struct
+import itertools
+import concurrent.futures
 import threading
 import time
 import logging
 import queue
-from datetime import datetime
-from collections import deque
+from array import array
+
+
+ICMP_ECHO_REQUEST = 8
+ICMP_ECHO_REPLY = 0
+PING_TIMEOUT = 5  # seconds to wait for an echo reply
+ICMP_PAYLOAD = b"ping-monitor".ljust(32, b"\x00")
+HISTORY_TIMEOUT = -1  # ping_ms marker for a timed out request
+HISTORY_ERROR = -2  # ping_ms marker for a failed request
+_HISTORY_MAX_MS = 32767  # largest value an "h" array slot can hold
+_PING_TIME_RE = re.compile(rb"time[<=](\d+(?:\.\d+)?)\s?ms")
+
+
+def _icmp_checksum(data):
+    """Compute the 16-bit one's-complement checksum of an ICMP packet."""
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def _round_trip_ms(seconds):
+    """Round a round-trip time to whole ms, reporting sub-ms replies as 1ms.
+
+    ping.exe shows those as "time<1ms", and 0 stays free for HISTORY_SENTINEL.
+    """
+    return max(1, round(seconds * 1000))
+
+
+def _parse_ping_time(output):
+    """Extract the round-trip time in ms from raw ping command output."""
+    # Fast path: "time=12ms" / "time<1ms" without running the regex engine
+    index = output.find(b"time=")
+    if index == -1:
+        index = output.find(b"time<")
+    if index != -1:
+        start = index + 5
+        end = output.find(b"ms", start)
+        if end != -1:
+            try:
+                return max(1, round(float(output[start:end])))
+            except ValueError:
+                pass
+
+    match = _PING_TIME_RE.search(output)
+    if match:
+        return max(1, round(float(match.group(1))))
+    return None
+
+
+def _build_echo_request(ident, seq):
+    """Build an ICMP echo request packet with a valid checksum."""
+    header = struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, 0, ident, seq)
+    checksum = _icmp_checksum(header + ICMP_PAYLOAD)
+    header = struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, checksum, ident, seq)
+    return header + ICMP_PAYLOAD
+
+
+class _IpOptionInformation(ctypes.Structure):
+    _fields_ = [
+        ("Ttl", ctypes.c_ubyte),
+        ("Tos", ctypes.c_ubyte),
+        ("Flags", ctypes.c_ubyte),
+        ("OptionsSize", ctypes.c_ubyte),
+        ("OptionsData", ctypes.c_void_p),
+    ]
+
+
+class _IcmpEchoReply(ctypes.Structure):
+    _fields_ = [
+        ("Address", ctypes.c_ulong),
+        ("Status", ctypes.c_ulong),
+        ("RoundTripTime", ctypes.c_ulong),
+        ("DataSize", ctypes.c_ushort),
+        ("Reserved", ctypes.c_ushort),
+        ("Data", ctypes.c_void_p),
+        ("Options", _IpOptionInformation),
+    ]
+
+
+class _IcmpEchoApi:
+    """Unprivileged ICMP echo through iphlpapi's IcmpSendEcho (Windows only)."""
+
+    def __init__(self):
+        iphlpapi = ctypes.WinDLL("iphlpapi.dll", use_last_error=True)
+        self._create_file = iphlpapi.IcmpCreateFile
+        self._create_file.restype = ctypes.c_void_p
+        self._send_echo = iphlpapi.IcmpSendEcho
+        self._send_echo.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_ulong,
+            ctypes.c_char_p,
+            ctypes.c_ushort,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.c_ulong,
+            ctypes.c_ulong,
+        ]
+        self._send_echo.restype = ctypes.c_ulong
+        self._close_handle = iphlpapi.IcmpCloseHandle
+        self._close_handle.argtypes = [ctypes.c_void_p]
+
+        self._handle = self._create_file()
+        if not self._handle or self._handle == ctypes.c_void_p(-1).value:
+            raise ctypes.WinError(ctypes.get_last_error())
+
+        # Reply header, echoed payload and room for an ICMP error message
+        self._reply_buffer = ctypes.create_string_buffer(
+            ctypes.sizeof(_IcmpEchoReply) + len(ICMP_PAYLOAD) + 8
+        )
+
+    def echo(self, ip_address, timeout=PING_TIMEOUT):
+        """Send one echo request and return the round-trip time in ms."""
+        # IPAddr holds the address in network byte order
+        address = struct.unpack("=L", socket.inet_aton(ip_address))[0]
+        replies = self._send_echo(
+            self._handle,
+            address,
+            ICMP_PAYLOAD,
+            len(ICMP_PAYLOAD),
+            None,
+            self._reply_buffer,
+            len(self._reply_buffer),
+            int(timeout * 1000),
+        )
+        if not replies:
+            return None
+
+        reply = _IcmpEchoReply.from_buffer(self._reply_buffer)
+        if reply.Status != 0:  # IP_SUCCESS
+            return None
+        return max(1, reply.RoundTripTime)
+
+    def close(self):
+        if self._handle:
+            self._close_handle(self._handle)
+            self._handle = None
 
 
 class PingService:
@@ -26,61 +169,259 @@ class PingService:
     ):
         self.logger = logging.getLogger(__name__)
         self.servers = servers
+        # Servers are fixed after startup, so enumerate them once
+        self._server_names = tuple(servers.keys())
+        self._server_items = tuple(servers.items())
         self.ping_interval = ping_interval
         self.ping_threshold_healthy = ping_threshold_healthy
         self.ping_threshold_degraded = ping_threshold_degraded
+        # Tag per whole-millisecond ping up to the degraded threshold, anything
+        # above it is "bad_ping"
+        self._ping_tags = tuple(
+            self._classify_ping_tag(ping_time)
+            for ping_time in range(max(0, ping_threshold_degraded + 1))
+        )
 
-        # Data storage - separate deque for each server
-        self.ping_results = {}
-        self.ping_times = {}  # For tracking raw ping times for statistics
-        self.ping_spike_counts = {}  # For tracking number of ping spikes
-
-        for server_name in servers.keys():
-            self.ping_results[server_name] = deque(maxlen=max_display_lines)
-            self.ping_times[server_name] = deque(maxlen=max_display_lines)
-            self.ping_spike_counts[server_name] = 0
+        # Display history - numeric ring buffers per server, formatted only
+        # when a tab has to be rebuilt. ping_ts holds epoch seconds, ping_ms
+        # the round trip or HISTORY_TIMEOUT / HISTORY_ERROR.
+        self.max_display_lines = max_display_lines
+        self.ping_ts = {}
+        self.ping_ms = {}
+        self._history_heads = {}
+        self._history_sizes = {}
+        self._history_errors = {}  # slot -> error message for HISTORY_ERROR
+
+        for server_name in self._server_names:
+            self.ping_ts[server_name] = array("I", [0]) * max_display_lines
+            self.ping_ms[server_name] = (
+                array("h", [HISTORY_TIMEOUT]) * max_display_lines
+            )
+            self._history_heads[server_name] = 0
+            self._history_sizes[server_name] = 0
+            self._history_errors[server_name] = {}
 
         self.ping_queue = queue.Queue()
+        # Optional wakeup called from ping threads after each queued result
+        self.on_result_queued = None
         self.running = True
         self.ping_thread_started = False
         self.server_threads = []
+        self._ping_pool = None  # created on first use by the blocking fan-out
+
+        # ICMP state - one socket per server worker, so replies never have to
+        # be handed over between threads. Raw sockets see every echo reply,
+        # so each server gets its own identifier to match replies against.
+        self._icmp_sockets = {}
+        self._icmp_raw = True
+        self._icmp_available = True
+        self._icmp_lock = threading.Lock()
+        # Set by stop(); no sockets or handles are opened after that, and
+        # sleeping per-server workers wake up to exit
+        self._stopped = False
+        self._stop_event = threading.Event()
+        # Windows refuses raw sockets without admin rights, but IcmpSendEcho
+        # works unprivileged. One handle per server worker, like the sockets.
+        self._icmp_apis = {}
+        self._icmp_api_available = os.name == "nt"
+        self._icmp_idents = {}
+        self._icmp_sequences = {}
+        for index, server_name in enumerate(self._server_names):
+            self._icmp_idents[server_name] = (os.getpid() + index) & 0xFFFF
+            self._icmp_sequences[server_name] = itertools.count(1)
+
+        # Last formatted display timestamp, shared by all servers
+        self._clock_second = None
+        self._clock_text = ""
+
+        # Hidden-console settings for the ping command fallback, built once
+        self._startupinfo = None
+        self._creationflags = 0
+        if os.name == "nt":  # Windows
+            self._startupinfo = subprocess.STARTUPINFO()
+            self._startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            self._startupinfo.wShowWindow = subprocess.SW_HIDE
+            self._creationflags = subprocess.CREATE_NO_WINDOW
 
     def reset_stats(self, server_name):
         """Reset statistics for a specific server"""
-        if server_name in self.ping_results:
-            self.ping_results[server_name].clear()
-            self.ping_times[server_name].clear()
-            self.ping_spike_counts[server_name] = 0
+        if server_name in self.ping_ts:
+            self._history_heads[server_name] = 0
+            self._history_sizes[server_name] = 0
+            self._history_errors[server_name].clear()
 
     def reset_all_stats(self):
         """Reset statistics for all servers"""
-        for server_name in self.servers.keys():
+        for server_name in self._server_names:
             self.reset_stats(server_name)
 
     def ping_server(self, server_name, ip_address):
         """Ping a single server and return the result"""
+        if self._stopped:
+            return {
+                "status": "error",
+                "time": None,
+                "server": server_name,
+                "error": "Ping service stopped",
+            }
+
+        sock = self._get_icmp_socket(server_name)
+        if sock is None:
+            icmp_api = self._get_icmp_api(server_name)
+            if icmp_api is None:
+                return self._ping_server_subprocess(server_name, ip_address)
+            return self._ping_server_icmp_api(server_name, ip_address, icmp_api)
+
         try:
-            # Set up subprocess to hide the console window
-            startupinfo = None
-            if os.name == "nt":  # Windows
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = subprocess.SW_HIDE
+            ident = self._icmp_idents[server_name]
+            seq = next(self._icmp_sequences[server_name]) & 0xFFFF
+            ping_time = self._icmp_echo(sock, ip_address, ident, seq)
+            if ping_time is None:
+                return {"status": "timeout", "time": None, "server": server_name}
+            return {"status": "success", "time": ping_time, "server": server_name}
+        except Exception as e:
+            return {
+                "status": "error",
+                "time": None,
+                "server": server_name,
+                "error": str(e),
+            }
 
+    def _open_icmp_socket(self):
+        """Open an ICMP socket, preferring raw and falling back to datagram."""
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP)
+            self._icmp_raw = True
+        except PermissionError:
+            # Unprivileged ICMP (Linux ping_group_range, macOS)
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+            self._icmp_raw = False
+        sock.setblocking(False)
+        return sock
+
+    def _get_icmp_socket(self, server_name):
+        """Return the cached ICMP socket for a server, or None if unavailable.
+
+        ``server_name`` of None selects the socket shared by ``ping_all_servers``.
+        """
+        sock = self._icmp_sockets.get(server_name)
+        if sock is not None or not self._icmp_available:
+            return sock
+
+        with self._icmp_lock:
+            if self._stopped or not self._icmp_available:
+                return None
+            try:
+                sock = self._open_icmp_socket()
+            except OSError as e:
+                self._icmp_available = False
+                self.logger.info(
+                    "ICMP sockets unavailable (%s), falling back to ping command", e
+                )
+                return None
+            self._icmp_sockets[server_name] = sock
+            return sock
+
+    def _get_icmp_api(self, server_name):
+        """Return the cached IcmpSendEcho wrapper for a server, or None."""
+        icmp_api = self._icmp_apis.get(server_name)
+        if icmp_api is not None or not self._icmp_api_available:
+            return icmp_api
+
+        with self._icmp_lock:
+            if self._stopped or not self._icmp_api_available:
+                return None
+            try:
+                icmp_api = _IcmpEchoApi()
+            except (OSError, AttributeError) as e:
+                self._icmp_api_available = False
+                self.logger.info(
+                    "IcmpSendEcho unavailable (%s), falling back to ping command", e
+                )
+                return None
+            self._icmp_apis[server_name] = icmp_api
+            return icmp_api
+
+    def _ping_server_icmp_api(self, server_name, ip_address, icmp_api):
+        """Ping a single server through IcmpSendEcho"""
+        try:
+            ping_time = icmp_api.echo(ip_address)
+            if ping_time is None:
+                return {"status": "timeout", "time": None, "server": server_name}
+            return {"status": "success", "time": ping_time, "server": server_name}
+        except Exception as e:
+            return {
+                "status": "error",
+                "time": None,
+                "server": server_name,
+                "error": str(e),
+            }
+
+    def _icmp_echo(self, sock, ip_address, ident, seq, timeout=PING_TIMEOUT):
+        """Send one echo request and return the round-trip time in ms."""
+        packet = _build_echo_request(ident, seq)
+        sent_at = time.perf_counter()
+        sock.sendto(packet, (ip_address, 0))
+
+        deadline = sent_at + timeout
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return None
+
+            ready, _, _ = select.select([sock], [], [], remaining)
+            if not ready:
+                return None
+
+            data, address = sock.recvfrom(1024)
+            received_at = time.perf_counter()
+            if address[0] != ip_address:
+                continue
+
+            reply = self._parse_echo_reply(data)
+            if reply is None:
+                continue
+
+            reply_ident, reply_seq = reply
+            # Datagram ICMP sockets get their identifier rewritten by the kernel,
+            # which also filters replies per socket, so only raw sockets check it.
+            if reply_seq == seq and (not self._icmp_raw or reply_ident == ident):
+                return _round_trip_ms(received_at - sent_at)
+
+    def _parse_echo_reply(self, data):
+        """Extract (identifier, sequence) from an echo reply, or None."""
+        if not data:
+            return None
+        # Raw sockets always deliver the IPv4 header; datagram sockets do on
+        # macOS/BSD but not on Linux. An ICMP echo reply starts with type 0,
+        # so a version nibble of 4 can only be an IP header.
+        offset = 0
+        if self._icmp_raw or data[0] >> 4 == 4:
+            offset = (data[0] & 0x0F) * 4
+        if len(data) < offset + 8:
+            return None
+
+        icmp_type, _, _, ident, seq = struct.unpack_from("!BBHHH", data, offset)
+        if icmp_type != ICMP_ECHO_REPLY:
+            return None
+        return ident, seq
+
+    def _ping_server_subprocess(self, server_name, ip_address):
+        """Ping a single server using the system ping command"""
+        try:
             # Use Windows ping command with specific options
             result = subprocess.run(
-                ["ping", "-n", "1", "-w", "5000", ip_address],
+                ["ping", "-n", "1", "-w", str(PING_TIMEOUT * 1000), ip_address],
                 capture_output=True,
-                text=True,
                 timeout=10,
-                startupinfo=startupinfo,  # Add this to hide command window
+                startupinfo=self._startupinfo,  # Hide the command window
+                creationflags=self._creationflags,
             )
 
             if result.returncode == 0:
                 # Parse ping time from output
-                match = re.search(r"time[<=](\d+)ms", result.stdout)
-                if match:
-                    ping_time = int(match.group(1))
+                ping_time = _parse_ping_time(result.stdout)
+                if ping_time is not None:
                     return {
                         "status": "success",
                         "time": ping_time,
@@ -103,30 +444,157 @@ class PingService:
                 "error": str(e),
             }
 
-    def ping_all_servers(self):
-        """Ping all servers concurrently"""
+    def ping_all_servers(self, on_result=None):
+        """Ping all servers concurrently, queueing results unless told otherwise"""
+        if on_result is None:
+            on_result = self._queue_result
+        if self._stopped:
+            return
 
-        def ping_worker(server_name, ip_address):
-            result = self.ping_server(server_name, ip_address)
-            result["timestamp"] = datetime.now()
-            self.ping_queue.put(result)
+        sock = self._get_icmp_socket(None)
+        if sock is None:
+            self._ping_all_servers_threaded(on_result)
+            return
 
-        # Create and start threads for each server
-        threads = []
-        for server_name, ip_address in self.servers.items():
-            thread = threading.Thread(
-                target=ping_worker, args=(server_name, ip_address)
+        # Send every echo request back-to-back, then collect replies in one loop
+        pending = {}
+        for server_name, ip_address in self._server_items:
+            ident = self._icmp_idents[server_name]
+            seq = next(self._icmp_sequences[server_name]) & 0xFFFF
+            try:
+                sock.sendto(_build_echo_request(ident, seq), (ip_address, 0))
+            except OSError as e:
+                on_result(
+                    {
+                        "status": "error",
+                        "time": None,
+                        "server": server_name,
+                        "error": str(e),
+                    }
+                )
+                continue
+            pending[(ip_address, seq)] = (server_name, ident, time.perf_counter())
+
+        deadline = time.perf_counter() + PING_TIMEOUT
+        while pending:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+
+            try:
+                ready, _, _ = select.select([sock], [], [], remaining)
+            except (OSError, ValueError):
+                break  # Socket closed by stop()
+            if not ready:
+                break
+
+            try:
+                data, address = sock.recvfrom(1024)
+            except OSError:
+                continue
+            received_at = time.perf_counter()
+
+            reply = self._parse_echo_reply(data)
+            if reply is None:
+                continue
+
+            reply_ident, reply_seq = reply
+            entry = pending.get((address[0], reply_seq))
+            if entry is None or (self._icmp_raw and reply_ident != entry[1]):
+                continue
+
+            del pending[(address[0], reply_seq)]
+            server_name, _, sent_at = entry
+            on_result(
+                {
+                    "status": "success",
+                    "time": _round_trip_ms(received_at - sent_at),
+                    "server": server_name,
+                }
             )
-            thread.start()
-            threads.append(thread)
 
-        # Wait for all threads to complete (with timeout)
-        for thread in threads:
-            thread.join(timeout=15)  # 15 second timeout per thread
+        for server_name, _, _ in pending.values():
+            on_result({"status": "timeout", "time": None, "server": server_name})
+
+    def _ping_all_servers_threaded(self, on_result):
+        """Fallback fan-out for blocking pings on a persistent thread pool."""
+
+        def ping_worker(server_name, ip_address):
+            on_result(self.ping_server(server_name, ip_address))
+
+        if not self._server_items:
+            return
+
+        with self._icmp_lock:
+            if self._stopped:
+                return
+            if self._ping_pool is None:
+                self._ping_pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=len(self._server_items), thread_name_prefix="ping"
+                )
+            ping_pool = self._ping_pool
+
+        futures = [
+            ping_pool.submit(ping_worker, server_name, ip_address)
+            for server_name, ip_address in self._server_items
+        ]
+        concurrent.futures.wait(futures, timeout=15)
+
+    def _queue_result(self, result):
+        """Timestamp a ping result and hand it over to the GUI thread."""
+        result["timestamp"] = time.time()
+        self.ping_queue.put(result)
+        if self.on_result_queued is not None and not self._stopped:
+            self.on_result_queued()
+
+    def record_result(self, server_name, result):
+        """Store a ping result in the server's numeric display history"""
+        if not self.max_display_lines:
+            return
+
+        head = self._history_heads[server_name]
+        errors = self._history_errors[server_name]
+        status = result["status"]
+        if status == "success":
+            ping_ms = min(result["time"], _HISTORY_MAX_MS)
+            errors.pop(head, None)
+        elif status == "timeout":
+            ping_ms = HISTORY_TIMEOUT
+            errors.pop(head, None)
+        else:
+            ping_ms = HISTORY_ERROR
+            errors[head] = result.get("error", "Unknown error")
+
+        self.ping_ts[server_name][head] = int(result["timestamp"])
+        self.ping_ms[server_name][head] = ping_ms
+        self._history_heads[server_name] = (head + 1) % self.max_display_lines
+        if self._history_sizes[server_name] < self.max_display_lines:
+            self._history_sizes[server_name] += 1
+
+    def iter_formatted_history(self, server_name):
+        """Yield the stored history oldest-first as formatted display results"""
+        size = self._history_sizes[server_name]
+        capacity = self.max_display_lines
+        start = (self._history_heads[server_name] - size) % capacity if size else 0
+        ping_ts = self.ping_ts[server_name]
+        ping_ms = self.ping_ms[server_name]
+        errors = self._history_errors[server_name]
+
+        for offset in range(size):
+            slot = (start + offset) % capacity
+            ping_time = ping_ms[slot]
+            if ping_time >= 0:
+                result = {"status": "success", "time": ping_time}
+            elif ping_time == HISTORY_TIMEOUT:
+                result = {"status": "timeout"}
+            else:
+                result = {"status": "error", "error": errors.get(slot, "Unknown error")}
+            result["timestamp"] = ping_ts[slot]
+            yield self.format_ping_result(server_name, result)
 
     def format_ping_result(self, server_name, result):
         """Format ping result for display"""
-        timestamp = result["timestamp"].strftime("%H:%M:%S")
+        timestamp = self._format_clock(result["timestamp"])
 
         if result["status"] == "success":
             ping_time = result["time"]
@@ -154,8 +622,26 @@ class PingService:
                 "ping_time": None,
             }
 
+    def _format_clock(self, timestamp):
+        """Format an epoch timestamp as local HH:MM:SS, reused within a second."""
+        second = int(timestamp)
+        if second != self._clock_second:
+            local_time = time.localtime(second)
+            self._clock_text = (
+                f"{local_time.tm_hour:02d}:{local_time.tm_min:02d}:"
+                f"{local_time.tm_sec:02d}"
+            )
+            self._clock_second = second
+        return self._clock_text
+
     def _get_ping_tag(self, ping_time):
         """Get the appropriate tag for ping time coloring"""
+        if 0 <= ping_time < len(self._ping_tags):
+            return self._ping_tags[ping_time]
+        return "bad_ping"
+
+    def _classify_ping_tag(self, ping_time):
+        """Tag rule behind the _ping_tags lookup table"""
         if ping_time < 40:
             return "excellent_ping"  # Green
         elif ping_time <= self.ping_threshold_degraded:
@@ -179,10 +665,8 @@ class PingService:
         """Perform warm-up pings to establish network connections"""
         self.logger.info("Performing warm-up pings")
         try:
-            # Ping each server once without recording results
-            for server_name, ip_address in self.servers.items():
-                # Just ping once and ignore the result
-                _ = self.ping_server(server_name, ip_address)
+            # Ping every server once in parallel and discard the results
+            self.ping_all_servers(on_result=lambda result: None)
 
             # Add a small delay to let the network settle
             time.sleep(1)
@@ -191,6 +675,20 @@ class PingService:
             self.logger.exception("Error during warm-up pings: %s", e)
             # Continue with the application even if warm-up fails
             pass
+        finally:
+            # The per-server workers use their own sockets, so the shared one
+            # would only queue up replies nobody reads
+            self._close_shared_icmp_socket()
+
+    def _close_shared_icmp_socket(self):
+        """Close the socket used by ping_all_servers, if one is open."""
+        with self._icmp_lock:
+            sock = self._icmp_sockets.pop(None, None)
+        if sock is not None:
+            try:
+                sock.close()
+            except OSError:
+                pass
 
     def ping_worker_thread(self):
         """Backward-compatible entrypoint for older integrations."""
@@ -201,7 +699,7 @@ class PingService:
         if self.server_threads:
             return
 
-        for server_name, ip_address in self.servers.items():
+        for server_name, ip_address in self._server_items:
             thread = threading.Thread(
                 target=self._per_server_worker,
                 args=(server_name, ip_address),
@@ -213,20 +711,13 @@ class PingService:
     def _per_server_worker(self, server_name, ip_address):
         """Ping one server repeatedly at a fixed interval."""
         try:
-            next_tick = time.perf_counter()
+            next_tick = time.monotonic()
 
             while self.running:
-                now = time.perf_counter()
-                if now < next_tick:
-                    time.sleep(min(0.05, next_tick - now))
-                    continue
-
-                result = self.ping_server(server_name, ip_address)
-                result["timestamp"] = datetime.now()
-                self.ping_queue.put(result)
+                self._queue_result(self.ping_server(server_name, ip_address))
 
                 next_tick += self.ping_interval
-                current_after_ping = time.perf_counter()
+                current_after_ping = time.monotonic()
 
                 # If the ping took too long, skip overdue ticks instead of burst-catchup.
                 if current_after_ping > next_tick:
@@ -235,6 +726,9 @@ class PingService:
                     )
                     next_tick += overdue_intervals * self.ping_interval
 
+                # Sleep straight to the next deadline instead of polling for it
+                self._stop_event.wait(max(0.0, next_tick - time.monotonic()))
+
         except Exception as e:
             self.logger.exception("Ping worker thread error (%s): %s", server_name, e)
 
@@ -248,4 +742,27 @@ class PingService:
 
     def stop(self):
         """Stop the ping service"""
-        self.running = False
+        with self._icmp_lock:
+            self.running = False
+            self._stopped = True
+            ping_pool, self._ping_pool = self._ping_pool, None
+        self._stop_event.set()
+
+        # Close sockets and handles right away so blocked pings fail fast.
+        # This usually runs on the Tk thread, so nothing here waits for the
+        # workers: they are daemons and exit on their own, and results they
+        # still produce no longer wake the GUI.
+        with self._icmp_lock:
+            for sock in self._icmp_sockets.values():
+                try:
+                    sock.close()
+                except OSError:
+                    pass
+            self._icmp_sockets.clear()
+
+            for icmp_api in self._icmp_apis.values():
+                icmp_api.close()
+            self._icmp_apis.clear()
+
+        if ping_pool is not None:
+            ping_pool.shutdown(wait=False, cancel_futures=True)
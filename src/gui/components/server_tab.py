@@ -1,10 +1,16 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext
-import time
 import os
 from PIL import Image, ImageTk
 
 
+# Keys that only move the view or selection in the read-only stream
+_NAVIGATION_KEYS = frozenset(
+    ("Up", "Down", "Left", "Right", "Prior", "Next", "Home", "End")
+)
+_CONTROL_MASK = 0x4
+
+
 class ServerTab:
     """Represents a single server tab in the UI"""
 
@@ -17,6 +23,7 @@ class ServerTab:
         animation_utils,
         root,
         app_running_check,
+        max_lines=None,
     ):
         self.notebook = notebook
         self.server_name = server_name
@@ -25,13 +32,25 @@ class ServerTab:
         self.animation_utils = animation_utils
         self.root = root
         self.app_running_check = app_running_check
+        self.max_lines = max_lines
 
+        self.tab_frame = None
         self.text_widget = None
         self.status_label = None
         self.overall_prefix_label = None
         self.overall_value_label = None
         self.stats_label = None
         self.pinged_label = None
+        # Last text/colour pushed to each footer label, so unchanged values
+        # skip Tk without a cget round-trip
+        self._label_values = {}
+        # Whether the view follows new entries; only user scrolling changes it
+        self.at_bottom = True
+        # Widgets inside the tab are built on first view, see materialize()
+        self.materialized = False
+        # Entries currently in the text widget, kept here so trimming needs
+        # no index query
+        self._entry_count = 0
 
         self._create_tab()
 
@@ -43,15 +62,27 @@ class ServerTab:
         style.configure("ServerTab.TFrame", background=self.theme["bg_color"])
         tab_frame = ttk.Frame(self.notebook, style="ServerTab.TFrame")
         self.notebook.add(tab_frame, text=f"{self.server_name}")
+        self.tab_frame = tab_frame
+
+    def materialize(self):
+        """Build the tab contents the first time the tab is shown"""
+        if self.materialized:
+            return
+        self.materialized = True
+        self._create_heavy_ui(self.tab_frame)
 
-        info_frame = tk.Frame(tab_frame, bg=self.theme["bg_color"], pady=10)
+    def _create_heavy_ui(self, tab_frame):
+        """Create the text stream and footer inside the tab frame"""
+        bg_color = self.theme["bg_color"]
+        text_color = self.theme["text_color"]
+        info_frame = tk.Frame(tab_frame, bg=bg_color, pady=10)
         info_frame.pack(fill=tk.X, padx=(15, 5))
 
         info_label = tk.Label(
             info_frame,
             text=f"{self.server_name} ({self.ip_address})",
             font=("Segoe UI", 12, "bold"),
-            bg=self.theme["bg_color"],
+            bg=bg_color,
             fg=self.theme["accent_color"],
             padx=5,
         )
@@ -68,25 +99,49 @@ class ServerTab:
             insertbackground=self.theme["log_text_color"],
             selectbackground="#b3d7ff",
             wrap=tk.WORD,
-            state=tk.DISABLED,
             borderwidth=0,
+            # Left in NORMAL state for fast appends, so hide the insert cursor
+            insertwidth=0,
+            # Read-only log, so keep Tk from recording every insert
+            undo=False,
+            autoseparators=False,
+            maxundo=0,
         )
         self.text_widget.pack(fill=tk.BOTH, expand=True)
         self.text_widget.tag_configure("excellent_ping", foreground="#009900")
         self.text_widget.tag_configure("good_ping", foreground="#b38f00")
         self.text_widget.tag_configure("bad_ping", foreground="#cc0000")
+        self.animation_utils.configure_fade_tags(self.text_widget)
 
-        status_frame = tk.Frame(tab_frame, bg=self.theme["bg_color"], height=30)
+        # Track the follow-the-end state from user scrolling instead of asking
+        # Tk for the view on every insert
+        for widget in (self.text_widget, self.text_widget.vbar):
+            for sequence in (
+                "<MouseWheel>",
+                "<Button-4>",
+                "<Button-5>",
+                "<KeyPress>",
+                "<ButtonRelease-1>",
+            ):
+                widget.bind(sequence, self._on_user_scroll, add="+")
+
+        # Read-only through bindings rather than state=DISABLED, so appending
+        # entries needs no state toggles around the insert
+        self.text_widget.bind("<Key>", self._block_edit, add="+")
+        for sequence in ("<<Paste>>", "<<PasteSelection>>", "<<Cut>>", "<<Clear>>"):
+            self.text_widget.bind(sequence, lambda event: "break")
+
+        status_frame = tk.Frame(tab_frame, bg=bg_color, height=30)
         status_frame.pack(fill=tk.X, pady=10, padx=5)
 
-        left_status_frame = tk.Frame(status_frame, bg=self.theme["bg_color"])
+        left_status_frame = tk.Frame(status_frame, bg=bg_color)
         left_status_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
         self.overall_prefix_label = tk.Label(
             left_status_frame,
             text="Overall ping: ",
-            bg=self.theme["bg_color"],
-            fg=self.theme["text_color"],
+            bg=bg_color,
+            fg=text_color,
             font=("Segoe UI", 9),
         )
         self.overall_prefix_label.pack(side=tk.LEFT)
@@ -94,7 +149,7 @@ class ServerTab:
         self.overall_value_label = tk.Label(
             left_status_frame,
             text="Healthy",
-            bg=self.theme["bg_color"],
+            bg=bg_color,
             fg="#00cc66",
             font=("Segoe UI", 9, "bold"),
         )
@@ -103,8 +158,8 @@ class ServerTab:
         self.stats_label = tk.Label(
             left_status_frame,
             text="",
-            bg=self.theme["bg_color"],
-            fg=self.theme["text_color"],
+            bg=bg_color,
+            fg=text_color,
             font=("Segoe UI", 9),
         )
         self.stats_label.pack(side=tk.LEFT)
@@ -112,65 +167,115 @@ class ServerTab:
         self.pinged_label = tk.Label(
             status_frame,
             text="",
-            bg=self.theme["bg_color"],
-            fg=self.theme["text_color"],
+            bg=bg_color,
+            fg=text_color,
             font=("Segoe UI", 9),
             width=38,
             anchor="e",
         )
         self.pinged_label.pack(side=tk.RIGHT)
 
-    def _create_heavy_ui(self, tab_frame):
-        """Deprecated: UI is now created immediately"""
-        pass
-
     def update_display(self, formatted_result, statistics=None):
         """Update the display with new ping result"""
-        try:
-            highlight_tag = f"highlight_{time.time()}"
+        self.update_display_batch([formatted_result], statistics)
 
-            # Enable text widget for updating
-            self.text_widget.config(state=tk.NORMAL)
+    def update_display_batch(self, formatted_results, statistics=None):
+        """Append several ping results with a single text widget insert"""
+        # Never-viewed tabs are filled from stored history when materialized
+        if not self.materialized:
+            return
 
-            # Add the new entry with its styling
-            if self.animation_utils.enabled:
-                self.text_widget.tag_configure(
-                    highlight_tag, background=self.theme["bg_highlight_color"]
-                )
-                self.text_widget.insert(
-                    tk.END,
-                    formatted_result["text"] + "\n",
-                    (formatted_result["tag"], highlight_tag),
-                )
-                # Schedule highlight fade-out
+        try:
+            # Background tabs get no fade or scroll work; switching to a tab
+            # scrolls it to the end anyway
+            selected = self.is_selected()
+
+            # Add the new entries with their styling in one Tcl call
+            insert_args = []
+            if self.animation_utils.enabled and selected:
+                fade_tag = self.animation_utils.newest_fade_tag
+                for formatted_result in formatted_results:
+                    insert_args.append(formatted_result["text"] + "\n")
+                    insert_args.append((formatted_result["tag"], fade_tag))
+                self.text_widget.insert(tk.END, *insert_args)
+                # Hand the new entries to the shared fade sweeper
                 self.animation_utils.fade_highlight(
-                    self.root,
-                    self.text_widget,
-                    highlight_tag,
-                    self.animation_utils.steps,
-                    self.app_running_check,
+                    self.root, self.text_widget, self.app_running_check
                 )
             else:
-                self.text_widget.insert(
-                    tk.END, formatted_result["text"] + "\n", formatted_result["tag"]
-                )
+                for formatted_result in formatted_results:
+                    insert_args.append(formatted_result["text"] + "\n")
+                    insert_args.append(formatted_result["tag"])
+                self.text_widget.insert(tk.END, *insert_args)
 
-            # Only auto-scroll if user is already at the bottom (within 5% of the end)
-            try:
-                first, last = self.text_widget.yview()
-                if last >= 0.95:  # User is near the bottom, auto-scroll to new content
-                    self.animation_utils.smooth_scroll_to_end(
-                        self.root, self.text_widget, self.app_running_check
-                    )
-            except tk.TclError:
-                pass  # Widget might be destroyed
+            self._entry_count += len(formatted_results)
+            self._trim_lines()
 
-            # Disable text widget
-            self.text_widget.config(state=tk.DISABLED)
+            # Only auto-scroll if user is already at the bottom
+            if selected and self.at_bottom:
+                self.text_widget.see(tk.END)
 
         except tk.TclError:
             pass
 
+        self._update_statistics(statistics)
+
+    def _on_user_scroll(self, event=None):
+        """Sample the view once the scroll binding has moved it"""
+        self.root.after_idle(self._update_at_bottom)
+
+    def _update_at_bottom(self):
+        """Follow new entries while the user is near the end (within 5%)"""
+        try:
+            self.at_bottom = self.text_widget.yview()[1] >= 0.95
+        except tk.TclError:
+            pass  # Widget might be destroyed
+
+    def _block_edit(self, event):
+        """Let navigation and copy keys through, swallow everything else"""
+        if event.keysym in _NAVIGATION_KEYS:
+            return None
+        if event.state & _CONTROL_MASK and event.keysym.lower() in ("c", "a"):
+            return None
+        return "break"
+
+    def is_selected(self):
+        """Check if this tab is the notebook's current tab"""
+        return self.notebook.select() == str(self.tab_frame)
+
+    def _trim_lines(self):
+        """Drop the oldest entries beyond max_lines with a single delete"""
+        if not self.max_lines or self._entry_count <= self.max_lines:
+            return
+        drop = self._entry_count - self.max_lines
+        self.text_widget.delete("1.0", f"{drop + 1}.0")
+        self._entry_count = self.max_lines
+
+    def repopulate(self, formatted_results, statistics=None):
+        """Replace the text widget content with stored results in one insert"""
+        if not self.materialized:
+            return
+
+        try:
+            self.text_widget.delete(1.0, tk.END)
+
+            insert_args = []
+            for formatted_result in formatted_results:
+                insert_args.append(formatted_result["text"] + "\n")
+                insert_args.append(formatted_result["tag"])
+            if insert_args:
+                self.text_widget.insert(tk.END, *insert_args)
+            self._entry_count = len(insert_args) // 2
+
+            self.text_widget.see(tk.END)
+            self.at_bottom = True
+        except tk.TclError:
+            pass
+
+        self._update_statistics(statistics)
+
+    def _update_statistics(self, statistics):
+        """Refresh the footer labels from a statistics dict"""
         if statistics and self.stats_label:
             overall_status = statistics.get("overall_status", "healthy")
             status_colors = {
@@ -183,14 +288,9 @@ class ServerTab:
             next_overall_fg = status_colors.get(
                 overall_status, self.theme["text_color"]
             )
-            if (
-                self.overall_value_label.cget("text") != next_overall_text
-                or self.overall_value_label.cget("fg") != next_overall_fg
-            ):
-                self.overall_value_label.config(
-                    text=next_overall_text,
-                    fg=next_overall_fg,
-                )
+            self._set_label(
+                self.overall_value_label, text=next_overall_text, fg=next_overall_fg
+            )
 
             status_text = (
                 f" (Best: {statistics['best']}ms | "
@@ -198,8 +298,7 @@ class ServerTab:
                 f"Avg: {round(statistics['avg'])}ms | "
                 f"Ping spikes: {statistics['ping_spikes']}x)"
             )
-            if self.stats_label.cget("text") != status_text:
-                self.stats_label.config(text=status_text)
+            self._set_label(self.stats_label, text=status_text)
 
             elapsed_minutes = max(1, statistics.get("elapsed_minutes", 1))
             minute_word = "minute" if elapsed_minutes == 1 else "minutes"
@@ -207,11 +306,18 @@ class ServerTab:
             pinged_text = (
                 f"Pinged {pinged_count} times over {elapsed_minutes} {minute_word}."
             )
-            if self.pinged_label.cget("text") != pinged_text:
-                self.pinged_label.config(text=pinged_text)
+            self._set_label(self.pinged_label, text=pinged_text)
+
+    def _set_label(self, label, **options):
+        """Configure a label only when its options differ from the last call"""
+        if self._label_values.get(label) != options:
+            label.config(**options)
+            self._label_values[label] = options
 
     def reset(self):
         """Reset the text widget content"""
-        self.text_widget.config(state=tk.NORMAL)
+        if not self.materialized:
+            return
         self.text_widget.delete(1.0, tk.END)
-        self.text_widget.config(state=tk.DISABLED)
+        self._entry_count = 0
+        self.at_bottom = True
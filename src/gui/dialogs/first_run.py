@@ -1,9 +1,47 @@
 import tkinter as tk
 from tkinter import messagebox
 import os
+import re
+import shutil
+import tempfile
+import threading
 import src.core.config as config_module
 
 
+CONFIG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "core",
+    "config.py",
+)
+_CLOSE_TO_TRAY_RE = re.compile(r"^CLOSE_TO_TRAY\s*=[^\r\n]*", re.MULTILINE)
+
+
+def save_close_to_tray(minimize):
+    """Persist CLOSE_TO_TRAY in config.py with an atomic replace."""
+    with open(CONFIG_PATH, "r", encoding="utf-8", newline="") as f:
+        text = f.read()
+
+    text = _CLOSE_TO_TRAY_RE.sub(f"CLOSE_TO_TRAY = {minimize}", text, count=1)
+
+    temp_handle = tempfile.NamedTemporaryFile(
+        "w",
+        encoding="utf-8",
+        newline="",
+        dir=os.path.dirname(CONFIG_PATH),
+        suffix=".tmp",
+        delete=False,
+    )
+    try:
+        with temp_handle:
+            temp_handle.write(text)
+        # NamedTemporaryFile is created 0600, keep config.py's own mode
+        shutil.copymode(CONFIG_PATH, temp_handle.name)
+        os.replace(temp_handle.name, CONFIG_PATH)
+    except BaseException:
+        os.remove(temp_handle.name)
+        raise
+
+
 class FirstRunDialog:
     """Dialog for first run configuration"""
 
@@ -41,50 +79,69 @@ class FirstRunDialog:
             justify=tk.CENTER,
         ).pack(pady=(0, 15))
 
+        # Only the first click may save and finish, later clicks are ignored
+        choice = {"made": False, "finished": False}
+        buttons = []
+
+        def set_buttons_state(state):
+            for button in buttons:
+                if button.winfo_exists():
+                    button.config(state=state)
+
+        def finish_behavior(minimize, error):
+            if choice["finished"] or not dialog.winfo_exists():
+                return
+
+            if error is not None:
+                messagebox.showerror("Error", f"Failed to save configuration: {error}")
+                # Let the user try again
+                choice["made"] = False
+                set_buttons_state(tk.NORMAL)
+                return
+
+            choice["finished"] = True
+
+            # Update runtime config
+            config_module.CLOSE_TO_TRAY = minimize
+
+            # Update protocol
+            if minimize:
+                self.root.protocol("WM_DELETE_WINDOW", self.app.hide_window)
+            else:
+                self.root.protocol("WM_DELETE_WINDOW", self.app.quit)
+
+            dialog.destroy()
+
+            # Notify completion
+            if self.on_complete:
+                self.on_complete()
+
         def set_behavior(minimize):
-            # Update config file
-            try:
-                config_path = os.path.join(
-                    os.path.dirname(
-                        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-                    ),
-                    "core",
-                    "config.py",
-                )
-
-                with open(config_path, "r") as f:
-                    lines = f.readlines()
-
-                with open(config_path, "w") as f:
-                    for line in lines:
-                        if line.strip().startswith("CLOSE_TO_TRAY"):
-                            f.write(f"CLOSE_TO_TRAY = {str(minimize)}\n")
-                        else:
-                            f.write(line)
-
-                # Update runtime config
-                config_module.CLOSE_TO_TRAY = minimize
-
-                # Update protocol
-                if minimize:
-                    self.root.protocol("WM_DELETE_WINDOW", self.app.hide_window)
-                else:
-                    self.root.protocol("WM_DELETE_WINDOW", self.app.quit)
-
-                dialog.destroy()
-
-                # Notify completion
-                if self.on_complete:
-                    self.on_complete()
-
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save configuration: {e}")
+            if choice["made"]:
+                return
+            choice["made"] = True
+            set_buttons_state(tk.DISABLED)
+
+            # Update config file off the UI thread, then finish back on it
+            def worker():
+                error = None
+                try:
+                    save_close_to_tray(minimize)
+                except Exception as e:
+                    error = e
+                try:
+                    self.root.after(0, lambda: finish_behavior(minimize, error))
+                except (tk.TclError, RuntimeError):
+                    # The dialog was closed and the app quit during the save
+                    pass
+
+            threading.Thread(target=worker, daemon=True).start()
 
         # Buttons
         btn_frame = tk.Frame(dialog, bg=self.theme["bg_color"])
         btn_frame.pack(pady=(0, 20))
 
-        tk.Button(
+        minimize_button = tk.Button(
             btn_frame,
             text="Minimize to Tray",
             command=lambda: set_behavior(True),
@@ -94,9 +151,10 @@ class FirstRunDialog:
             padx=15,
             pady=5,
             relief=tk.FLAT,
-        ).pack(side=tk.LEFT, padx=10)
+        )
+        minimize_button.pack(side=tk.LEFT, padx=10)
 
-        tk.Button(
+        exit_button = tk.Button(
             btn_frame,
             text="Exit Application",
             command=lambda: set_behavior(False),
@@ -106,7 +164,9 @@ class FirstRunDialog:
             padx=15,
             pady=5,
             relief=tk.FLAT,
-        ).pack(side=tk.LEFT, padx=10)
+        )
+        exit_button.pack(side=tk.LEFT, padx=10)
+        buttons.extend((minimize_button, exit_button))
 
         # Close app if dialog is closed without choice
         def on_dialog_close():
@@ -5,7 +5,16 @@ Main GUI window for the Ping Monitor application.
 import tkinter as tk
 from tkinter import ttk, font, Menu, scrolledtext
 import os
+import glob
+import time
+import queue
+import hashlib
+import tempfile
+import threading
+import functools
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image, ImageTk
 from src.core.config import (
     THEME,
@@ -25,11 +34,38 @@ except Exception:
     FAIcon = None
 
 
+@functools.lru_cache(maxsize=32)
+def _render_icon(name, size, color):
+    """Render a Font Awesome icon once per (name, size, color)."""
+    if FAIcon is None:
+        raise RuntimeError(
+            "ttkbootstrap-icons-fa is required for toolbar icon rendering."
+        )
+    return FAIcon(name, size=size, color=color, style="solid").image
+
+
+_PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+BG_PATH = os.path.join(_PROJECT_ROOT, BACKGROUND_FILE)
+ICON_PATH = os.path.join(_PROJECT_ROOT, "assets", "icon.ico")
+CONFIG_PATH = os.path.join(_PROJECT_ROOT, "src", "core", "config.py")
+PING_SPIKES_PATH = os.path.join(_PROJECT_ROOT, PING_SPIKES_FILE)
+
+GUI_TICK_MS = 1000  # safety-net drain in case a ping wakeup event is lost
+RESIZE_DEBOUNCE_MS = 300  # quiet time after the last resize before resampling
+BG_CACHE_SIZE = 4  # rendered backgrounds kept for window sizes seen before
+BG_DISK_CACHE_PREFIX = os.path.join(tempfile.gettempdir(), "ping_monitor_bg_")
+BG_DISK_CACHE_MAX_AGE = 30 * 24 * 3600  # seconds before unused entries are removed
+
+
 class MainWindow:
     """Main application window with tabbed interface"""
 
     def __init__(self, servers, app_instance):
         self.servers = servers
+        # Tab order, so tab indexes map to servers without building a list
+        self._server_names = tuple(servers.keys())
         self.app = app_instance
         self.theme = THEME
         self.logger = logging.getLogger(__name__)
@@ -42,6 +78,12 @@ class MainWindow:
         self.bg_image_original = None
         self.bg_image_tk = None
         self.bg_label = None
+        # (width, height) -> PhotoImage, least recently used first
+        self._bg_cache = OrderedDict()
+        # Single worker resampling the background off the Tk thread, and the
+        # latest job submitted to it; older jobs are superseded
+        self._bg_executor = None
+        self._bg_future = None
         self.overlay_backdrop = None
         self.overlay_backdrop_image = None
         self.overlay_backdrop_photo = None
@@ -51,16 +93,27 @@ class MainWindow:
         self.logs_refresh_job = None
         self.overlay_backdrop_refresh_job = None
         self.last_logs_content = None
+        # One tooltip label shared by all toolbar buttons, created on first hover
+        self._tooltip_label = None
 
         # Resize handling
         self.resize_timer = None
-        self.is_resizing = False
         self.resize_overlay = None
+        self._resize_overlay_shown = False
+        self._last_bg_size = (0, 0)
 
         # Utilities
         self.animation_utils = AnimationUtils(THEME, ANIMATION_SETTINGS)
         self.toast_manager = None
 
+        # Display updates collected while draining the ping queue
+        self._pending_results = {}
+        self._pending_statistics = {}
+        # Set while hidden, the tabs are rebuilt from stored history on show
+        self._tabs_stale = False
+        # Set while a <<PingArrived>> wakeup is queued but not yet handled
+        self._drain_pending = False
+
         # State flags
         self.updates_paused = False
 
@@ -82,7 +135,7 @@ class MainWindow:
                 self.window_visible = True
                 self.updates_paused = False
                 self.app.start_services()
-                self._start_gui_update_thread()
+                self._start_gui_updates()
 
             dialog = FirstRunDialog(self.root, self.theme, self.app, on_complete)
             dialog.show()
@@ -96,7 +149,7 @@ class MainWindow:
 
             # Start background services immediately for normal run
             self.app.start_services()
-            self._start_gui_update_thread()
+            self._start_gui_updates()
 
     def _setup_gui(self):
         """Setup the main GUI window with tabbed interface"""
@@ -106,18 +159,14 @@ class MainWindow:
         self.root.report_callback_exception = self._handle_tk_exception
 
         # Load background image
-        bg_path = os.path.join(
-            os.path.dirname(
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            ),
-            BACKGROUND_FILE,
-        )
-        if os.path.exists(bg_path):
+        if os.path.exists(BG_PATH):
             try:
-                self.bg_image_original = Image.open(bg_path)
+                self.bg_image_original = self._load_background(BG_PATH)
                 self.bg_label = tk.Label(self.root, borderwidth=0)
                 self.bg_label.place(x=0, y=0, relwidth=1, relheight=1)
-                self.root.bind("<Configure>", self._resize_background)
+                # The label always fills the root, and unlike a root binding it
+                # is not also triggered by every child widget's <Configure>
+                self.bg_label.bind("<Configure>", self._resize_background)
             except Exception as e:
                 self.logger.exception("Error loading background image: %s", e)
                 self.root.configure(bg=self.theme["bg_color"])
@@ -125,16 +174,9 @@ class MainWindow:
             self.root.configure(bg=self.theme["bg_color"])
 
         # Set application icon with absolute path
-        icon_path = os.path.join(
-            os.path.dirname(
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            ),
-            "assets",
-            "icon.ico",
-        )
-        if os.path.exists(icon_path):
+        if os.path.exists(ICON_PATH):
             try:
-                self.root.iconbitmap(default=icon_path)
+                self.root.iconbitmap(default=ICON_PATH)
                 self._set_windows_app_id()
             except tk.TclError as e:
                 self.logger.exception("Error setting window icon: %s", e)
@@ -158,81 +200,199 @@ class MainWindow:
         self._create_main_layout()
         self._create_server_tabs()
         self.toast_manager = ToastManager(self.root)
-        # Note: _start_gui_update_thread is now called after configuration/startup
+        # Note: _start_gui_updates is now called after configuration/startup
+
+    def _load_background(self, bg_path):
+        """Open the background once, pre-scaled to just cover the screen"""
+        screen_w = self.root.winfo_screenwidth()
+        screen_h = self.root.winfo_screenheight()
+
+        # The screen-sized copy is cached across launches, keyed by the source
+        # file (path and size), its modification time and the screen size
+        source_stat = os.stat(bg_path)
+        source_key = f"{os.path.realpath(bg_path)}|{source_stat.st_size}"
+        source_hash = hashlib.sha1(source_key.encode("utf-8")).hexdigest()[:12]
+        cache_path = (
+            f"{BG_DISK_CACHE_PREFIX}{source_hash}_{screen_w}x{screen_h}_"
+            f"{int(source_stat.st_mtime)}.png"
+        )
+        if os.path.exists(cache_path):
+            try:
+                image = Image.open(cache_path)
+                image.load()
+                # Mark the entry as used, so cleanup keeps it
+                os.utime(cache_path)
+                return image
+            except OSError as e:
+                self.logger.warning("Ignoring unreadable background cache: %s", e)
+
+        image = Image.open(bg_path)
+        # JPEG backgrounds can be decoded at a reduced scale; other formats ignore it
+        image.draft("RGB", (screen_w, screen_h))
+        ratio = max(screen_w / image.width, screen_h / image.height)
+        if ratio < 1:
+            image = image.resize(
+                (round(image.width * ratio), round(image.height * ratio)),
+                Image.Resampling.LANCZOS,
+                reducing_gap=3.0,
+            )
+            threading.Thread(
+                target=self._save_background_cache,
+                args=(image, cache_path),
+                daemon=True,
+            ).start()
+        else:
+            image.load()
+        return image
+
+    def _save_background_cache(self, image, cache_path):
+        """Write the pre-scaled background and drop stale cache entries"""
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            # Written aside and renamed, so a reader never sees a partial PNG
+            try:
+                image.save(temp_path, format="PNG")
+                os.replace(temp_path, cache_path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+
+            expired = time.time() - BG_DISK_CACHE_MAX_AGE
+            for path in glob.glob(f"{glob.escape(BG_DISK_CACHE_PREFIX)}*.png"):
+                if path != cache_path and os.path.getmtime(path) < expired:
+                    os.remove(path)
+        except OSError as e:
+            self.logger.warning("Could not cache background image: %s", e)
 
     def _resize_background(self, event):
         """Resize background image to fit window with debounce"""
-        if event.widget != self.root:
-            return
-
-        if not self.bg_image_original or not self.bg_label:
+        if not self.bg_image_original:
             return
 
         # Only resize if dimensions changed significantly
-        if (
-            hasattr(self, "_last_bg_size")
-            and abs(self._last_bg_size[0] - event.width) < 10
-            and abs(self._last_bg_size[1] - event.height) < 10
-        ):
+        last_w, last_h = self._last_bg_size
+        if abs(last_w - event.width) < 10 and abs(last_h - event.height) < 10:
             return
 
-        # Cancel previous timer
-        if self.resize_timer:
-            self.root.after_cancel(self.resize_timer)
-
         # Show overlay to cover white background during resize
-        if not self.is_resizing:
-            self.is_resizing = True
-            self._show_resize_overlay()
+        self._show_resize_overlay()
+        if self.resize_timer is not None:
+            self.root.after_cancel(self.resize_timer)
 
         # Schedule the actual resize
         self.resize_timer = self.root.after(
-            300, lambda: self._perform_resize(event.width, event.height)
+            RESIZE_DEBOUNCE_MS, self._perform_resize, event.width, event.height
         )
 
     def _show_resize_overlay(self):
         """Show overlay to cover white background during resize"""
+        if self._resize_overlay_shown:
+            return
         if not self.resize_overlay:
             self.resize_overlay = tk.Frame(self.root, bg=self.theme["bg_color"])
 
         self.resize_overlay.place(x=0, y=0, relwidth=1, relheight=1)
         self.resize_overlay.lift()
+        self._resize_overlay_shown = True
+
+    def _hide_resize_overlay(self):
+        """Reveal the window again once the new background is in place"""
+        if self._resize_overlay_shown:
+            self.resize_overlay.place_forget()
+            self._resize_overlay_shown = False
 
     def _perform_resize(self, width, height):
         """Perform the actual background resize"""
-        self.is_resizing = False
+        self.resize_timer = None
+        self._last_bg_size = (width, height)
 
-        # Hide overlay
-        if self.resize_overlay:
-            self.resize_overlay.place_forget()
+        # Maximize/restore and similar toggles return to sizes already rendered
+        size = (max(1, width), max(1, height))
+        cached = self._bg_cache.get(size)
+        if cached is not None:
+            # A resample still in flight is stale now, it must not overwrite this
+            if self._bg_future is not None:
+                self._bg_future.cancel()
+                self._bg_future = None
+            self._bg_cache.move_to_end(size)
+            self.bg_image_tk = cached
+            self.bg_label.configure(image=cached)
+            self._hide_resize_overlay()
+            return
 
-        self._last_bg_size = (width, height)
+        # Resample in the worker; PIL releases the GIL while it works, so the
+        # Tk loop keeps running. Only the newest request is worth finishing.
+        if self._bg_future is not None:
+            self._bg_future.cancel()
+        if self._bg_executor is None:
+            self._bg_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="background-resize"
+            )
+        self._bg_future = self._bg_executor.submit(self._resample_background, size)
+        self._bg_future.add_done_callback(self._on_background_resampled)
 
-        # Resize image using LANCZOS and crop to center
+    def _resample_background(self, size):
+        """Crop and scale the background to size, runs in the resize worker"""
+        # Resample only the centred source region that covers the window, so
+        # LANCZOS never runs over pixels the crop would throw away
         img_w, img_h = self.bg_image_original.size
-        target_w, target_h = width, height
+        target_w, target_h = size
 
         ratio = max(target_w / img_w, target_h / img_h)
-        new_w = int(img_w * ratio)
-        new_h = int(img_h * ratio)
-
-        resized = self.bg_image_original.resize(
-            (new_w, new_h), Image.Resampling.LANCZOS
+        box_w = target_w / ratio
+        box_h = target_h / ratio
+        left = (img_w - box_w) / 2
+        top = (img_h - box_h) / 2
+
+        return self.bg_image_original.resize(
+            (target_w, target_h),
+            Image.Resampling.LANCZOS,
+            box=(left, top, left + box_w, top + box_h),
+            reducing_gap=2.0,
         )
 
-        # Crop to center
-        left = (new_w - target_w) / 2
-        top = (new_h - target_h) / 2
-        right = (new_w + target_w) / 2
-        bottom = (new_h + target_h) / 2
+    def _on_background_resampled(self, future):
+        """Hand a finished resample back to the Tk thread"""
+        if future.cancelled():
+            return
+        try:
+            self.root.after(0, self._apply_background, future)
+        except (tk.TclError, RuntimeError):
+            pass  # Tk is already gone
+
+    def _apply_background(self, future):
+        """Show a resampled background unless a newer resize superseded it"""
+        if future is not self._bg_future:
+            return
+        self._bg_future = None
+
+        try:
+            cropped = future.result()
+        except Exception as e:
+            self.logger.exception("Error resizing background image: %s", e)
+            self._hide_resize_overlay()
+            return
 
-        cropped = resized.crop((left, top, right, bottom))
+        width, height = self._last_bg_size
+        if cropped.size != (max(1, width), max(1, height)):
+            return
 
+        # PhotoImage belongs to the Tk interpreter, so it is built here
         self.bg_image_tk = ImageTk.PhotoImage(cropped)
         self.bg_label.configure(image=self.bg_image_tk)
+        self._hide_resize_overlay()
+
+        self._bg_cache[cropped.size] = self.bg_image_tk
+        if len(self._bg_cache) > BG_CACHE_SIZE:
+            self._bg_cache.popitem(last=False)
 
     def _set_windows_app_id(self):
         """Set Windows app ID for better taskbar integration"""
+        # Stays on the startup path: the ID only applies to windows shown after
+        # it is set, so it must not race the first map of the root window
+        if os.name != "nt":
+            return
         try:
             import ctypes
 
@@ -255,7 +415,8 @@ class MainWindow:
 
     def _create_toolbar(self, parent):
         """Create the toolbar with icon buttons"""
-        toolbar_frame = tk.Frame(parent, bg=self.theme["bg_color"])
+        bg_color = self.theme["bg_color"]
+        toolbar_frame = tk.Frame(parent, bg=bg_color)
         toolbar_frame.pack(fill=tk.X, pady=5, padx=5)
 
         self.icons = {
@@ -267,7 +428,7 @@ class MainWindow:
         btn_config = tk.Label(
             toolbar_frame,
             image=self.icons["config"],
-            bg=self.theme["bg_color"],
+            bg=bg_color,
             cursor="hand2",
         )
         btn_config.pack(side=tk.LEFT, padx=(5, 1))
@@ -277,7 +438,7 @@ class MainWindow:
         btn_logs = tk.Label(
             toolbar_frame,
             image=self.icons["logs"],
-            bg=self.theme["bg_color"],
+            bg=bg_color,
             cursor="hand2",
         )
         btn_logs.pack(side=tk.LEFT, padx=1)
@@ -287,7 +448,7 @@ class MainWindow:
         btn_reset = tk.Label(
             toolbar_frame,
             image=self.icons["reset"],
-            bg=self.theme["bg_color"],
+            bg=bg_color,
             cursor="hand2",
         )
         btn_reset.pack(side=tk.LEFT, padx=1)
@@ -296,52 +457,45 @@ class MainWindow:
 
     def _draw_icon(self, name, size=24):
         """Render toolbar icons using Font Awesome icons."""
-        if FAIcon is None:
-            raise RuntimeError(
-                "ttkbootstrap-icons-fa is required for toolbar icon rendering."
-            )
-        return FAIcon(
-            name, size=size, color=self.theme["accent_color"], style="solid"
-        ).image
+        return _render_icon(name, size, self.theme["accent_color"])
 
     def _create_tooltip(self, widget, text):
         """Create a simple tooltip for a widget"""
 
         def enter(event):
             x, y, _, _ = widget.bbox("insert")
-            x += widget.winfo_rootx() + 25
-            y += widget.winfo_rooty() + 20
+            x += widget.winfo_rootx() - self.root.winfo_rootx() + 25
+            y += widget.winfo_rooty() - self.root.winfo_rooty() + 20
+
+            # Placed inside the root window, so showing it needs no WM round-trip
+            tooltip_label = self._get_tooltip_label()
+            tooltip_label.config(text=text)
+            tooltip_label.place(x=x, y=y)
+            tooltip_label.lift()
 
-            self.tooltip = tk.Toplevel(widget)
-            self.tooltip.wm_overrideredirect(True)
-            self.tooltip.wm_geometry(f"+{x}+{y}")
+        def leave(event):
+            if self._tooltip_label is not None:
+                self._tooltip_label.place_forget()
 
-            label = tk.Label(
-                self.tooltip,
-                text=text,
+        widget.bind("<Enter>", enter)
+        widget.bind("<Leave>", leave)
+
+    def _get_tooltip_label(self):
+        """Return the shared tooltip label, creating it on first use"""
+        if self._tooltip_label is None:
+            self._tooltip_label = tk.Label(
+                self.root,
                 background="#ffffe0",
                 relief="solid",
                 borderwidth=1,
                 font=("Segoe UI", 8),
             )
-            label.pack()
-
-        def leave(event):
-            if hasattr(self, "tooltip"):
-                self.tooltip.destroy()
-
-        widget.bind("<Enter>", enter)
-        widget.bind("<Leave>", leave)
+        return self._tooltip_label
 
     def _open_config(self):
         """Open config file"""
         try:
-            config_path = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-                "core",
-                "config.py",
-            )
-            os.startfile(config_path)
+            os.startfile(CONFIG_PATH)
         except Exception as e:
             self.logger.exception("Error opening config: %s", e)
 
@@ -406,6 +560,10 @@ class MainWindow:
             wrap=tk.NONE,
             state=tk.DISABLED,
             borderwidth=0,
+            # Read-only log, so keep Tk from recording every insert
+            undo=False,
+            autoseparators=False,
+            maxundo=0,
             padx=10,
             pady=10,
         )
@@ -417,18 +575,17 @@ class MainWindow:
 
     def _get_logs_file_path(self):
         """Resolve ping spikes file path."""
-        return os.path.join(
-            os.path.dirname(
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            ),
-            PING_SPIKES_FILE,
-        )
+        return PING_SPIKES_PATH
 
     def _refresh_logs_overlay(self):
         """Reload logs text and schedule periodic refresh while overlay is open."""
         if not (self.logs_window and self.logs_window.winfo_exists()):
             return
 
+        # Spikes are written through a buffer, push them out before reading
+        if self.app.ping_spike_logger:
+            self.app.ping_spike_logger.flush()
+
         log_path = self._get_logs_file_path()
         if not os.path.exists(log_path):
             content = "No ping spikes recorded yet."
@@ -500,7 +657,7 @@ class MainWindow:
         if not current_tab:
             return
         tab_index = self.notebook.index(current_tab)
-        server_name = list(self.servers.keys())[tab_index]
+        server_name = self._server_names[tab_index]
 
         self.app.ping_service.reset_stats(server_name)
         self.app.reset_server_statistics(server_name)
@@ -532,9 +689,10 @@ class MainWindow:
 
     def _configure_notebook_style(self):
         """Configure the notebook styling"""
+        bg_color = self.theme["bg_color"]
         style = ttk.Style()
         style.theme_use("clam")
-        style.configure("TNotebook", background=self.theme["bg_color"], borderwidth=0)
+        style.configure("TNotebook", background=bg_color, borderwidth=0)
         style.configure(
             "TNotebook.Tab",
             background=self.theme["inactive_tab_bg"],
@@ -544,16 +702,19 @@ class MainWindow:
         )
         style.map(
             "TNotebook.Tab",
-            background=[("selected", self.theme["bg_color"])],
+            background=[("selected", bg_color)],
             foreground=[("selected", self.theme["accent_color"])],
         )
-        style.configure("TFrame", background=self.theme["bg_color"])
+        style.configure("TFrame", background=bg_color)
 
     def _create_server_tabs(self):
         """Create a tab for each server"""
-        for server_name in self.servers.keys():
+        for server_name in self._server_names:
             self._create_server_tab(server_name)
 
+        # Only the initially selected tab is built up front, the rest on first view
+        self.server_tabs[self._server_names[0]].materialize()
+
     def _create_server_tab(self, server_name):
         """Create a tab for a specific server"""
         ip_address = self.servers[server_name]
@@ -567,52 +728,112 @@ class MainWindow:
             self.animation_utils,
             self.root,
             lambda: self.app.running,
+            max_lines=self.app.max_display_lines_per_server,
         )
 
         # Store reference
         self.server_tabs[server_name] = tab
 
     def update_display(self, server_name, formatted_result, statistics=None):
-        """Update the display for a specific server"""
-        if server_name in self.server_tabs:
-            self.server_tabs[server_name].update_display(formatted_result, statistics)
-
-    def _start_gui_update_thread(self):
-        """Start the GUI update thread"""
+        """Queue a display update for a server, applied by the next flush"""
+        if server_name not in self.server_tabs:
+            return
+        self._pending_results.setdefault(server_name, []).append(formatted_result)
+        self._pending_statistics[server_name] = statistics
+
+    def _flush_display_updates(self):
+        """Apply queued display updates with one widget update per tab"""
+        # Nobody sees the text widgets while the window is hidden; show()
+        # rebuilds them from the stored ping history instead.
+        if not self.window_visible:
+            if self._pending_results:
+                self._tabs_stale = True
+            self._pending_results.clear()
+            self._pending_statistics.clear()
+            return
 
-        def update_gui_periodically():
-            """Update GUI from the main thread"""
-            try:
-                if (
-                    self.app.ping_service
-                    and not self.app.ping_service.ping_queue.empty()
-                ):
-                    result = self.app.ping_service.ping_queue.get_nowait()
-                    self.app._process_ping_result(result)
-            except:
-                pass
-            finally:
-                # Schedule next update from main thread
-                if self.root and self.app.running:
-                    self.root.after(100, update_gui_periodically)
+        for server_name, formatted_results in self._pending_results.items():
+            self.server_tabs[server_name].update_display_batch(
+                formatted_results, self._pending_statistics.get(server_name)
+            )
+        self._pending_results.clear()
+        self._pending_statistics.clear()
 
-        # Start the periodic updates from the main thread
+    def _start_gui_updates(self):
+        """Drain the ping queue on the Tk main loop whenever results arrive"""
         if self.root:
-            self.root.after(100, update_gui_periodically)
+            self.root.bind("<<PingArrived>>", self._on_ping_arrived)
+            if self.app.ping_service:
+                self.app.ping_service.on_result_queued = self._notify_ping_arrived
+            self.root.after(GUI_TICK_MS, self._gui_tick)
+
+    def _notify_ping_arrived(self):
+        """Wake the Tk loop from a ping thread, at most once per drain"""
+        if self._drain_pending:
+            return
+        self._drain_pending = True
+        try:
+            self.root.event_generate("<<PingArrived>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            # Tk not running yet or already gone, the periodic tick catches up
+            self._drain_pending = False
+
+    def _on_ping_arrived(self, _event=None):
+        """Handle a wakeup posted by a ping thread"""
+        # Clear first, so results queued during the drain post a new wakeup
+        self._drain_pending = False
+        self._drain_queue()
+
+    def _gui_tick(self):
+        """Periodic safety-net drain, rescheduled on the main thread"""
+        try:
+            self._drain_queue()
+        finally:
+            if self.root and self.app.running:
+                self.root.after(GUI_TICK_MS, self._gui_tick)
+
+    def _drain_queue(self):
+        """Apply every queued ping result and flush the display once"""
+        try:
+            if self.app.ping_service:
+                ping_queue = self.app.ping_service.ping_queue
+                while True:
+                    try:
+                        result = ping_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    self.app._process_ping_result(result)
+                self._flush_display_updates()
+        except Exception as e:
+            self.logger.exception("Error updating GUI: %s", e)
 
     def _on_tab_changed(self, event):
-        """Auto-scroll to bottom when switching tabs"""
+        """Auto-scroll to bottom when switching to a tab that follows the end"""
         try:
             current_tab = self.notebook.select()
             if not current_tab:
                 return
 
             tab_index = self.notebook.index(current_tab)
-            server_name = list(self.servers.keys())[tab_index]
+            server_name = self._server_names[tab_index]
 
-            if server_name in self.server_tabs:
-                text_widget = self.server_tabs[server_name].text_widget
-                text_widget.see(tk.END)
+            server_tab = self.server_tabs.get(server_name)
+            if server_tab is None:
+                return
+
+            # First view builds the widgets and fills them from stored history
+            if not server_tab.materialized:
+                server_tab.materialize()
+                server_tab.repopulate(
+                    self.app.ping_service.iter_formatted_history(server_name),
+                    self.app.get_server_statistics(server_name),
+                )
+                return
+
+            # Tabs the user scrolled back keep their position; others catch up
+            # with the entries appended while they were in the background
+            if server_tab.at_bottom:
+                server_tab.text_widget.see(tk.END)
         except Exception:
             pass
 
@@ -633,9 +854,20 @@ class MainWindow:
         """Reset notebook cursor on leave."""
         self.notebook.configure(cursor="")
 
+    def _repopulate_tabs(self):
+        """Rebuild every tab from stored ping history after being hidden"""
+        self._tabs_stale = False
+        for server_name, tab in self.server_tabs.items():
+            tab.repopulate(
+                self.app.ping_service.iter_formatted_history(server_name),
+                self.app.get_server_statistics(server_name),
+            )
+
     def show(self):
         """Show the main window"""
         if self.root:
+            if self._tabs_stale:
+                self._repopulate_tabs()
             self.root.deiconify()
             self.root.lift()
             self.root.focus_force()
@@ -647,6 +879,8 @@ class MainWindow:
         if self.root:
             self.root.withdraw()
             self.window_visible = False
+            # No display work happens while hidden, so rebuild on next show
+            self._tabs_stale = True
             self.logger.info("Main window hidden")
 
     def is_visible(self):
@@ -659,10 +893,19 @@ class MainWindow:
             self.root.mainloop()
 
     def destroy(self):
-        """Destroy the window"""
+        """Destroy the window once the Tk loop is idle, safe from any thread"""
         if self.root:
-            self._close_logs_overlay(cancel_toast=True)
-            self.root.destroy()
+            try:
+                self.root.after_idle(self._destroy_now)
+            except (tk.TclError, RuntimeError):
+                pass  # Tk is already gone
+
+    def _destroy_now(self):
+        """Tear down the overlay and the root window on the Tk thread"""
+        self._close_logs_overlay(cancel_toast=True)
+        if self._bg_executor is not None:
+            self._bg_executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
 
     def _handle_tk_exception(self, exc_type, exc_value, exc_traceback):
         """Capture Tk callback exceptions into app logging."""
@@ -3,14 +3,54 @@ System tray icon functionality for the Ping Monitor application.
 """
 
 import os
+import logging
 import pystray
-from PIL import Image, ImageDraw
+from PIL import Image
+
+
+ICON_SIZE = 32
+_ICON_CENTER = 16
+_ICON_RADIUS = 12.5
+
+# (fill, outline) RGBA colors per tray status
+ICON_COLORS = {
+    "neutral": ((128, 128, 128, 255), (80, 80, 80, 255)),
+    "healthy": ((0, 255, 0, 255), (0, 150, 0, 255)),
+    "degraded": ((255, 200, 0, 255), (170, 130, 0, 255)),
+    "failing": ((255, 0, 0, 255), (150, 0, 0, 255)),
+}
+
+
+def _build_circle_mask():
+    """Classify each icon pixel as 0 = transparent, 1 = outline, 2 = fill."""
+    outer = _ICON_RADIUS**2
+    inner = (_ICON_RADIUS - 1) ** 2
+    mask = bytearray(ICON_SIZE * ICON_SIZE)
+    for y in range(ICON_SIZE):
+        for x in range(ICON_SIZE):
+            distance = (x - _ICON_CENTER) ** 2 + (y - _ICON_CENTER) ** 2
+            if distance <= inner:
+                mask[y * ICON_SIZE + x] = 2
+            elif distance <= outer:
+                mask[y * ICON_SIZE + x] = 1
+    return bytes(mask)
+
+
+_CIRCLE_MASK = _build_circle_mask()
+
+
+def _circle_icon(fill, outline):
+    """Build a circle icon straight from RGBA bytes, without ImageDraw."""
+    palette = (bytes(4), bytes(outline), bytes(fill))
+    pixels = b"".join([palette[value] for value in _CIRCLE_MASK])
+    return Image.frombytes("RGBA", (ICON_SIZE, ICON_SIZE), pixels)
 
 
 class SystemTray:
     """Handles system tray icon and menu functionality"""
 
     def __init__(self, app_instance, icon_path=None):
+        self.logger = logging.getLogger(__name__)
         self.app = app_instance
         self.icon_path = icon_path
         self.tray_icon = None
@@ -65,56 +105,35 @@ class SystemTray:
 
     def _create_circle_icons(self):
         """Create simple colored circles for tray icon"""
-        size = (32, 32)
-
-        # Neutral (Grey) - Initial state
-        neutral_img = Image.new("RGBA", size, (0, 0, 0, 0))
-        draw = ImageDraw.Draw(neutral_img)
-        # Draw circle
-        draw.ellipse(
-            [4, 4, 28, 28], fill=(128, 128, 128, 255), outline=(80, 80, 80, 255)
-        )
-        self.icon_images["neutral"] = neutral_img
-
-        # Green - Good connection
-        green_img = Image.new("RGBA", size, (0, 0, 0, 0))
-        draw = ImageDraw.Draw(green_img)
-        draw.ellipse([4, 4, 28, 28], fill=(0, 255, 0, 255), outline=(0, 150, 0, 255))
-        self.icon_images["green"] = green_img
-        self.icon_images["healthy"] = green_img
-
-        # Yellow - Degraded connection
-        yellow_img = Image.new("RGBA", size, (0, 0, 0, 0))
-        draw = ImageDraw.Draw(yellow_img)
-        draw.ellipse(
-            [4, 4, 28, 28], fill=(255, 200, 0, 255), outline=(170, 130, 0, 255)
-        )
-        self.icon_images["yellow"] = yellow_img
-        self.icon_images["degraded"] = yellow_img
+        for status, (fill, outline) in ICON_COLORS.items():
+            self.icon_images[status] = _circle_icon(fill, outline)
 
-        # Red - Failing connection
-        red_img = Image.new("RGBA", size, (0, 0, 0, 0))
-        draw = ImageDraw.Draw(red_img)
-        draw.ellipse([4, 4, 28, 28], fill=(255, 0, 0, 255), outline=(150, 0, 0, 255))
-        self.icon_images["red"] = red_img
-        self.icon_images["failing"] = red_img
+        # Color aliases for older callers
+        self.icon_images["green"] = self.icon_images["healthy"]
+        self.icon_images["yellow"] = self.icon_images["degraded"]
+        self.icon_images["red"] = self.icon_images["failing"]
 
     def update_health_status(self, health_status):
         """Update tray icon and tooltip for Healthy/Degraded/Failing states."""
-        if health_status not in {"healthy", "degraded", "failing"}:
+        if health_status not in ICON_COLORS:
             health_status = "neutral"
-
-        if health_status != self.current_status:
-            self.current_status = health_status
-            if self.tray_icon and self.icon_images.get(health_status):
-                self.tray_icon.icon = self.icon_images[health_status]
-                self.refresh_menu()
-
-        if self.tray_icon:
-            if health_status == "neutral":
+        self._set_icon(health_status)
+
+    def _set_icon(self, status):
+        """Swap icon and tooltip, touching the shell only when status changes."""
+        if status == self.current_status or not self.tray_icon:
+            return
+
+        self.current_status = status
+        self.icon_image = self.icon_images[status]
+        try:
+            self.tray_icon.icon = self.icon_image
+            if status == "neutral":
                 self.tray_icon.title = "Ping Monitor"
             else:
-                self.tray_icon.title = f"Ping Monitor - {health_status.title()}"
+                self.tray_icon.title = f"Ping Monitor - {status.title()}"
+        except Exception as e:
+            self.logger.exception("Error updating tray icon: %s", e)
 
     def refresh_menu(self):
         """Refresh the tray menu to reflect current state"""
@@ -122,7 +141,7 @@ class SystemTray:
             try:
                 self.tray_icon.update_menu()
             except Exception as e:
-                print(f"Error refreshing tray menu: {e}")
+                self.logger.exception("Error refreshing tray menu: %s", e)
 
     def run(self):
         """Start the system tray icon"""
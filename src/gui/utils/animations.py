@@ -8,101 +8,74 @@ class AnimationUtils:
         self.theme = theme
         self.enabled = animation_settings.get("enabled", True)
         self.duration = animation_settings.get("duration", 800)
-        self.steps = animation_settings.get("steps", 8)
-
-    def fade_highlight(self, root, text_widget, tag, steps_left, app_running_check):
-        """Fade out the highlight of new entries"""
-        if steps_left <= 0 or not app_running_check():
-            try:
-                # Set to normal background color and remove the tag
-                text_widget.tag_configure(tag, background=self.theme["log_bg_color"])
-                text_widget.tag_delete(tag)
-            except tk.TclError:
-                pass  # Widget might be destroyed
-            return
-
-        try:
-            # Calculate interpolation between highlight color and log background color
-            progress = steps_left / self.steps  # 1.0 to 0.0
-
-            # Extract RGB values from highlight color
-            highlight_r = int(self.theme["bg_highlight_color"][1:3], 16)
-            highlight_g = int(self.theme["bg_highlight_color"][3:5], 16)
-            highlight_b = int(self.theme["bg_highlight_color"][5:7], 16)
-
-            # Extract RGB values from log background color
-            log_bg_r = int(self.theme["log_bg_color"][1:3], 16)
-            log_bg_g = int(self.theme["log_bg_color"][3:5], 16)
-            log_bg_b = int(self.theme["log_bg_color"][5:7], 16)
-
-            # Interpolate between highlight and log background colors
-            r = int(highlight_r * progress + log_bg_r * (1 - progress))
-            g = int(highlight_g * progress + log_bg_g * (1 - progress))
-            b = int(highlight_b * progress + log_bg_b * (1 - progress))
-
-            new_color = f"#{r:02x}{g:02x}{b:02x}"
-
-            # Update highlight color
-            text_widget.tag_configure(tag, background=new_color)
-
-            # Schedule next fade step
-            step_time = self.duration // self.steps
-            root.after(
-                step_time,
-                lambda: self.fade_highlight(
-                    root, text_widget, tag, steps_left - 1, app_running_check
-                ),
+        self.steps = max(1, animation_settings.get("steps", 8))
+
+        # Fixed pool of fade tags shared by every text widget, so the tag
+        # table stays constant no matter how many entries are highlighted
+        self.fade_tags = tuple(f"fade{step}" for step in range(self.steps))
+        self.newest_fade_tag = self.fade_tags[-1]
+        self.fade_colors = self._build_fade_colors()
+        self._fading_widgets = set()
+        self._sweep_job = None
+
+    def _build_fade_colors(self):
+        """Precompute the highlight background for every fade step"""
+        highlight = self.theme["bg_highlight_color"]
+        log_bg = self.theme["log_bg_color"]
+        highlight_rgb = [int(highlight[i : i + 2], 16) for i in (1, 3, 5)]
+        log_bg_rgb = [int(log_bg[i : i + 2], 16) for i in (1, 3, 5)]
+
+        colors = []
+        for step in range(self.steps):
+            # fade{steps-1} is the full highlight, fade0 the last visible step
+            progress = (step + 1) / self.steps
+            r, g, b = (
+                int(high * progress + low * (1 - progress))
+                for high, low in zip(highlight_rgb, log_bg_rgb)
             )
-        except tk.TclError:
-            pass  # Widget might be destroyed
-
-    def smooth_scroll_to_end(self, root, text_widget, app_running_check):
-        """Smoothly scroll to the end of the text widget"""
-        try:
-            # Get current view
-            first, last = text_widget.yview()
-
-            # If we're already at the bottom, no need to animate
-            if last >= 0.99:
-                text_widget.see(tk.END)
-                return
-
-            # Otherwise smoothly scroll
-            self.animate_scroll(
-                root, text_widget, first, 1.0, self.steps, app_running_check
+            colors.append(f"#{r:02x}{g:02x}{b:02x}")
+        return colors
+
+    def configure_fade_tags(self, text_widget):
+        """Create the fixed pool of fade tags on a text widget once"""
+        for tag, color in zip(self.fade_tags, self.fade_colors):
+            text_widget.tag_configure(tag, background=color)
+
+    def fade_highlight(self, root, text_widget, app_running_check):
+        """Fade out entries tagged with newest_fade_tag on the shared sweeper"""
+        self._fading_widgets.add(text_widget)
+        if self._sweep_job is None:
+            self._sweep_job = root.after(
+                self.duration // self.steps,
+                lambda: self._sweep_fades(root, app_running_check),
             )
-        except tk.TclError:
-            pass  # Widget might be destroyed
 
-    def animate_scroll(
-        self, root, text_widget, start_pos, end_pos, steps_left, app_running_check
-    ):
-        """Animate scrolling from start_pos to end_pos in steps"""
-        if steps_left <= 0 or not app_running_check():
-            try:
-                text_widget.see(tk.END)  # Ensure we end at the bottom
-            except tk.TclError:
-                pass
+    def _sweep_fades(self, root, app_running_check):
+        """Demote every faded range by one step across all registered widgets"""
+        self._sweep_job = None
+        if not app_running_check():
+            self._fading_widgets.clear()
             return
 
-        try:
-            # Calculate intermediate position
-            progress = (self.steps - steps_left) / self.steps
-            pos = start_pos + ((end_pos - start_pos) * progress)
-            text_widget.yview_moveto(pos)
+        for text_widget in list(self._fading_widgets):
+            try:
+                still_fading = False
+                # Oldest step first, so each range moves exactly one step
+                for step, tag in enumerate(self.fade_tags):
+                    ranges = text_widget.tag_ranges(tag)
+                    if not ranges:
+                        continue
+                    text_widget.tag_remove(tag, "1.0", tk.END)
+                    if step > 0:
+                        text_widget.tag_add(self.fade_tags[step - 1], *ranges)
+                        still_fading = True
+                if not still_fading:
+                    self._fading_widgets.discard(text_widget)
+            except tk.TclError:
+                self._fading_widgets.discard(text_widget)  # Widget destroyed
 
-            # Schedule next animation step
-            step_time = 20  # milliseconds between steps (smoother)
-            root.after(
-                step_time,
-                lambda: self.animate_scroll(
-                    root,
-                    text_widget,
-                    start_pos,
-                    end_pos,
-                    steps_left - 1,
-                    app_running_check,
-                ),
+        if self._fading_widgets:
+            self._sweep_job = root.after(
+                self.duration // self.steps,
+                lambda: self._sweep_fades(root, app_running_check),
             )
-        except tk.TclError:
-            pass  # Widget might be destroyed
@@ -2,14 +2,20 @@
 Application logging setup utilities.
 """
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 
 def configure_app_logging():
-    """Configure app-wide logging to logs/app.log and console."""
+    """Configure app-wide logging to logs/app.log and console.
+
+    Records are handed to a background listener through a queue, so a slow
+    disk or a blocked console never stalls the Tk or ping threads.
+    """
     if getattr(sys, "frozen", False):
         project_root = Path(sys.executable).resolve().parent
     else:
@@ -40,8 +46,14 @@ def configure_app_logging():
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
 
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    root_logger.addHandler(QueueHandler(log_queue))
 
     def _log_excepthook(exc_type, exc_value, exc_traceback):
         logging.getLogger(__name__).exception(
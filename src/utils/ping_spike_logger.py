@@ -4,13 +4,28 @@ Ping spike logging utilities for tracking high ping events.
 
 import os
 import sys
+import time
+import queue
+import atexit
 import logging
-from datetime import datetime, timedelta
+import tempfile
+import threading
 from pathlib import Path
 
 
 LOGGER = logging.getLogger(__name__)
 
+if getattr(sys, "frozen", False):
+    _PROJECT_ROOT = Path(sys.executable).resolve().parent
+else:
+    _PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+WRITE_BATCH_SIZE = 256  # most queued entries the writer joins into one write
+FLUSH_TIMEOUT = 0.5  # seconds flush() waits, it is called from the Tk thread
+CLOSE_JOIN_TIMEOUT = 2.0  # seconds close() waits for the writer to finish
+_WRITER_STOP = object()  # queue sentinel that ends the writer loop
+
 
 class PingSpikeLogger:
     """Handles logging and management of ping spikes."""
@@ -19,19 +34,24 @@ class PingSpikeLogger:
         self.ping_spikes_file = self._resolve_path(ping_spikes_file)
         self.retention_hours = retention_hours
         os.makedirs(os.path.dirname(self.ping_spikes_file), exist_ok=True)
+
+        # Spikes are queued by the GUI thread and written by a background
+        # writer through a long-lived append handle, opened on the first spike
+        self._lock = threading.Lock()
+        self._file_handle = None
+        self._write_queue = queue.Queue()
+        self._writer_thread = None
+        self._closed = False
+        atexit.register(self.close)
+
         self._migrate_legacy_files()
         self.cleanup_ping_spikes_file()
 
-    def _project_root(self):
-        if getattr(sys, "frozen", False):
-            return Path(sys.executable).resolve().parent
-        return Path(__file__).resolve().parents[2]
-
     def _resolve_path(self, ping_spikes_file):
         target_path = Path(ping_spikes_file)
         if target_path.is_absolute():
             return str(target_path)
-        return str((self._project_root() / target_path).resolve())
+        return str((_PROJECT_ROOT / target_path).resolve())
 
     def _migrate_legacy_files(self):
         """Move legacy log files to the current target log filename."""
@@ -40,7 +60,7 @@ class PingSpikeLogger:
             if target_name != "ping_spikes.log":
                 return
 
-            project_root = str(self._project_root())
+            project_root = str(_PROJECT_ROOT)
             log_dir = os.path.dirname(self.ping_spikes_file)
 
             legacy_candidates = ["ping_spikes.txt", "deviations.txt"]
@@ -84,7 +104,9 @@ class PingSpikeLogger:
     def log_ping_spike(self, server_name, result):
         """Log a ping spike (high ping) to the ping spikes file."""
         try:
-            timestamp = result["timestamp"].strftime("%Y-%m-%d %H:%M:%S")
+            timestamp = time.strftime(
+                TIMESTAMP_FORMAT, time.localtime(result["timestamp"])
+            )
 
             if result["status"] == "success":
                 ping_time = result["time"]
@@ -92,65 +114,214 @@ class PingSpikeLogger:
             else:
                 log_entry = f"[{timestamp}] {server_name}: {result['status']}\n"
 
-            with open(self.ping_spikes_file, "a", encoding="utf-8") as file_handle:
-                file_handle.write(log_entry)
+            if self._closed:
+                # No writer after shutdown, append the entry directly
+                with self._lock:
+                    self._write_entries_locked([log_entry])
+                return
+
+            self._ensure_writer()
+            self._write_queue.put(log_entry)
 
         except Exception as error:
             LOGGER.exception("Error logging ping spike: %s", error)
 
+    def _ensure_writer(self):
+        if self._writer_thread is not None:
+            return
+        with self._lock:
+            if self._writer_thread is None and not self._closed:
+                self._writer_thread = threading.Thread(
+                    target=self._writer_loop, name="ping-spike-writer", daemon=True
+                )
+                self._writer_thread.start()
+
+    def _writer_loop(self):
+        """Write queued entries in batches, one write and flush per batch."""
+        stopping = False
+        while not stopping:
+            entries = [self._write_queue.get()]
+            while len(entries) < WRITE_BATCH_SIZE:
+                try:
+                    entries.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if _WRITER_STOP in entries:
+                stopping = True
+            batch = [entry for entry in entries if entry is not _WRITER_STOP]
+
+            try:
+                if batch:
+                    with self._lock:
+                        self._write_entries_locked(batch)
+            except Exception as error:
+                LOGGER.exception("Error writing ping spikes: %s", error)
+            finally:
+                for _ in entries:
+                    self._write_queue.task_done()
+
+    def flush(self, timeout=FLUSH_TIMEOUT):
+        """Wait up to timeout seconds for queued ping spikes to reach disk.
+
+        Returns True when everything queued has been written.
+        """
+        deadline = time.monotonic() + timeout
+        done = self._write_queue.all_tasks_done
+        with done:
+            while self._write_queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                done.wait(remaining)
+        return True
+
+    def close(self):
+        """Write any queued ping spikes and close the file handle."""
+        try:
+            with self._lock:
+                if self._closed:
+                    return
+                self._closed = True
+                writer = self._writer_thread
+
+            # Let the writer finish the entries it already holds in order,
+            # then write whatever it left behind ourselves
+            if writer is not None and writer is not threading.current_thread():
+                self._write_queue.put(_WRITER_STOP)
+                writer.join(timeout=CLOSE_JOIN_TIMEOUT)
+
+            with self._lock:
+                entries = []
+                while True:
+                    try:
+                        entries.append(self._write_queue.get_nowait())
+                    except queue.Empty:
+                        break
+                batch = [entry for entry in entries if entry is not _WRITER_STOP]
+                try:
+                    if batch:
+                        self._write_entries_locked(batch)
+                finally:
+                    for _ in entries:
+                        self._write_queue.task_done()
+                self._close_locked()
+        except Exception as error:
+            LOGGER.exception("Error closing ping spikes file: %s", error)
+
+    def _write_entries_locked(self, entries):
+        if self._closed and self._file_handle is None:
+            # Late write after close(), append without keeping a handle open
+            with open(self.ping_spikes_file, "a", encoding="utf-8") as handle:
+                handle.write("".join(entries))
+            return
+        if self._file_handle is None:
+            self._file_handle = open(
+                self.ping_spikes_file, "a", encoding="utf-8", buffering=8192
+            )
+        self._file_handle.write("".join(entries))
+        self._file_handle.flush()
+
+    def _close_locked(self):
+        if self._file_handle is not None:
+            self._file_handle.close()
+            self._file_handle = None
+
     def cleanup_ping_spikes_file(self):
         """Clean up old entries from the ping spikes file."""
         try:
-            if not os.path.exists(self.ping_spikes_file):
-                return
+            with self._lock:
+                # The file is rewritten below, so release the append handle first
+                self._close_locked()
+                self._cleanup_ping_spikes_file_locked()
+        except Exception as error:
+            LOGGER.exception("Error during ping spike file cleanup: %s", error)
 
-            content = self._read_text_file(self.ping_spikes_file)
-            lines = content.splitlines(keepends=True)
+    def _cleanup_ping_spikes_file_locked(self):
+        if not os.path.exists(self.ping_spikes_file):
+            return
 
-            cutoff_time = datetime.now() - timedelta(hours=self.retention_hours)
-            filtered_lines = []
+        # Timestamps are zero-padded "%Y-%m-%d %H:%M:%S", so they sort as strings
+        cutoff = time.strftime(
+            TIMESTAMP_FORMAT, time.localtime(time.time() - self.retention_hours * 3600)
+        )
+        log_dir = os.path.dirname(self.ping_spikes_file)
 
-            for line in lines:
+        temp_handle = tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=log_dir, suffix=".tmp", delete=False
+        )
+        try:
+            with temp_handle:
                 try:
-                    if line.startswith("[") and "] " in line:
-                        timestamp_str = line[1 : line.index("] ")]
-                        line_time = datetime.strptime(
-                            timestamp_str, "%Y-%m-%d %H:%M:%S"
+                    with open(
+                        self.ping_spikes_file, "r", encoding="utf-8"
+                    ) as source_handle:
+                        temp_handle.writelines(
+                            self._filter_recent_lines(source_handle, cutoff)
                         )
+                except UnicodeDecodeError:
+                    # Legacy file in another encoding, fall back to a full read
+                    temp_handle.seek(0)
+                    temp_handle.truncate()
+                    content = self._read_text_file(self.ping_spikes_file)
+                    temp_handle.writelines(
+                        self._filter_recent_lines(
+                            content.splitlines(keepends=True), cutoff
+                        )
+                    )
+            os.replace(temp_handle.name, self.ping_spikes_file)
+        except BaseException:
+            os.remove(temp_handle.name)
+            raise
+
+    def _filter_recent_lines(self, lines, cutoff):
+        """Yield log lines newer than the cutoff, keeping unparsable stamps."""
+        for line in lines:
+            if not line.startswith("["):
+                continue
+            stamp_end = line.find("] ")
+            if stamp_end == -1:
+                continue
 
-                        if line_time > cutoff_time:
-                            filtered_lines.append(line)
-                except (ValueError, IndexError):
-                    filtered_lines.append(line)
-
-            with open(self.ping_spikes_file, "w", encoding="utf-8") as file_handle:
-                file_handle.writelines(filtered_lines)
-
-        except Exception as error:
-            LOGGER.exception("Error during ping spike file cleanup: %s", error)
+            timestamp_str = line[1:stamp_end]
+            if not self._is_timestamp(timestamp_str) or timestamp_str > cutoff:
+                yield line
+
+    @staticmethod
+    def _is_timestamp(value):
+        return (
+            len(value) == 19
+            and value[4] == "-"
+            and value[7] == "-"
+            and value[10] == " "
+            and value[13] == ":"
+            and value[16] == ":"
+        )
 
     def get_recent_ping_spikes_count(self, server_name, hours=24):
         """Get count of recent ping spikes for a specific server."""
+        self.flush()
         try:
             if not os.path.exists(self.ping_spikes_file):
                 return 0
 
-            count = 0
-            cutoff_time = datetime.now() - timedelta(hours=hours)
+            # Compare zero-padded timestamp strings like the cleanup does, and
+            # match the server name right after the stamp, not anywhere
+            cutoff = time.strftime(
+                TIMESTAMP_FORMAT, time.localtime(time.time() - hours * 3600)
+            )
+            server_prefix = f"] {server_name}:"
 
+            count = 0
             content = self._read_text_file(self.ping_spikes_file)
             for line in content.splitlines():
-                try:
-                    if server_name in line and line.startswith("["):
-                        timestamp_str = line[1 : line.index("] ")]
-                        line_time = datetime.strptime(
-                            timestamp_str, "%Y-%m-%d %H:%M:%S"
-                        )
-
-                        if line_time > cutoff_time:
-                            count += 1
-                except (ValueError, IndexError):
-                    continue
+                if (
+                    line.startswith("[")
+                    and line.startswith(server_prefix, 20)
+                    and self._is_timestamp(line[1:20])
+                    and line[1:20] > cutoff
+                ):
+                    count += 1
 
             return count
 
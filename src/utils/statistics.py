@@ -6,6 +6,105 @@ from collections import deque
 from datetime import datetime, timedelta
 
 
+class RollingWindow:
+    """Fixed-size window of ping times with O(1) average, minimum and maximum"""
+
+    def __init__(self, maxlen):
+        self.values = deque(maxlen=maxlen)
+        self.total = 0
+        # Monotonic (sequence, value) deques; the front is the window's
+        # minimum / maximum and entries that can never win again are dropped
+        self._sequence = 0
+        self._minimums = deque()
+        self._maximums = deque()
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def append(self, value):
+        """Add a sample, subtracting the one the deque evicts"""
+        if len(self.values) == self.values.maxlen:
+            self.total -= self.values[0]
+        self.values.append(value)
+        self.total += value
+
+        sequence = self._sequence
+        self._sequence += 1
+        while self._minimums and self._minimums[-1][1] >= value:
+            self._minimums.pop()
+        self._minimums.append((sequence, value))
+        while self._maximums and self._maximums[-1][1] <= value:
+            self._maximums.pop()
+        self._maximums.append((sequence, value))
+
+        oldest = sequence - len(self.values) + 1
+        if self._minimums[0][0] < oldest:
+            self._minimums.popleft()
+        if self._maximums[0][0] < oldest:
+            self._maximums.popleft()
+
+    def clear(self):
+        self.values.clear()
+        self.total = 0
+        self._minimums.clear()
+        self._maximums.clear()
+
+    @property
+    def average(self):
+        return self.total / len(self.values) if self.values else 0.0
+
+    @property
+    def minimum(self):
+        return self._minimums[0][1] if self.values else 0
+
+    @property
+    def maximum(self):
+        return self._maximums[0][1] if self.values else 0
+
+
+# Seeds every ServerStats.history so it is never empty. It is older than any
+# window and its 0ms ping is healthy, so it never changes a status outcome.
+HISTORY_SENTINEL = (float("-inf"), 0)
+
+
+class ServerStats:
+    """All monitor-side statistics of one server, kept in one object"""
+
+    __slots__ = (
+        "ping_times",
+        "history",
+        "ping_spike_count",
+        "pinged_count",
+        "first_timestamp",
+        "last_degraded_timestamp",
+        "last_failing_timestamp",
+    )
+
+    def __init__(self, maxlen):
+        self.ping_times = RollingWindow(maxlen)
+        # (timestamp, ping_time) pairs for the overall status window
+        self.history = deque([HISTORY_SENTINEL], maxlen=maxlen)
+        self.ping_spike_count = 0
+        self.pinged_count = 0
+        self.first_timestamp = None
+        # Newest sample above each threshold, so status needs no history scan
+        self.last_degraded_timestamp = None
+        self.last_failing_timestamp = None
+
+    def reset(self):
+        self.ping_times.clear()
+        self.history.clear()
+        self.history.append(HISTORY_SENTINEL)
+        self.ping_spike_count = 0
+        self.pinged_count = 0
+        self.first_timestamp = None
+        self.last_degraded_timestamp = None
+        self.last_failing_timestamp = None
+
+
 class PingStatistics:
     """Handles calculation and tracking of ping statistics"""
 
@@ -14,11 +113,13 @@ class PingStatistics:
         self.ping_times = {}
         self.ping_spike_counts = {}
         self.last_reset = datetime.now()
+        # Day number of last_reset, so the daily check is an int compare
+        self._last_reset_ordinal = self.last_reset.toordinal()
 
     def initialize_server(self, server_name):
         """Initialize statistics tracking for a server"""
         if server_name not in self.ping_times:
-            self.ping_times[server_name] = deque(maxlen=self.max_samples)
+            self.ping_times[server_name] = RollingWindow(self.max_samples)
             self.ping_spike_counts[server_name] = 0
 
     def add_ping_time(self, server_name, ping_time, is_ping_spike=False):
@@ -33,11 +134,10 @@ class PingStatistics:
 
     def get_average_ping(self, server_name):
         """Get average ping time for a server"""
-        if server_name not in self.ping_times or not self.ping_times[server_name]:
+        ping_times = self.ping_times.get(server_name)
+        if ping_times is None:
             return 0.0
-
-        ping_times = list(self.ping_times[server_name])
-        return sum(ping_times) / len(ping_times)
+        return ping_times.average
 
     def get_ping_spike_count(self, server_name):
         """Get ping spike count for a server"""
@@ -46,11 +146,12 @@ class PingStatistics:
     def get_statistics(self, server_name):
         """Get comprehensive statistics for a server"""
         self.initialize_server(server_name)
+        ping_times = self.ping_times[server_name]
 
         return {
-            "avg": self.get_average_ping(server_name),
-            "ping_spikes": self.get_ping_spike_count(server_name),
-            "sample_count": len(self.ping_times[server_name]),
+            "avg": ping_times.average,
+            "ping_spikes": self.ping_spike_counts[server_name],
+            "sample_count": len(ping_times),
         }
 
     def get_deviation_count(self, server_name):
@@ -60,7 +161,8 @@ class PingStatistics:
     def reset_daily_stats(self):
         """Reset daily statistics if needed"""
         now = datetime.now()
-        if now.date() > self.last_reset.date():
-            for server_name in self.ping_spike_counts:
-                self.ping_spike_counts[server_name] = 0
+        now_ordinal = now.toordinal()
+        if now_ordinal > self._last_reset_ordinal:
+            self.ping_spike_counts = dict.fromkeys(self.ping_spike_counts, 0)
             self.last_reset = now
+            self._last_reset_ordinal = now_ordinal